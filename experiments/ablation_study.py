@@ -13,7 +13,7 @@ import json
 from datetime import datetime
 from typing import Dict, List
 
-from tmf921.core import ScenarioDataset, GSTSpecification, TMF921Validator, OllamaClient
+from tmf921.core import ScenarioDataset, TMF921Validator, OllamaClient, load_gst_specification
 from tmf921.prompting import TMF921PromptBuilder, EXAMPLE_SCENARIOS
 from tmf921.rag import GSTRetriever
 from tmf921.post_processing import CharacteristicNameMapper
@@ -44,7 +44,7 @@ class AblationStudy:
         self.results = {}
         
         # Initialize components
-        self.gst = GSTSpecification("gst.json")
+        self.gst = load_gst_specification("gst.json")
         self.validator = TMF921Validator(self.gst.spec)
         self.prompt_builder = TMF921PromptBuilder(self.gst.spec)
         self.name_mapper = CharacteristicNameMapper(self.gst.spec)
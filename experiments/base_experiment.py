@@ -6,21 +6,71 @@ common functionality for running experiments, tracking metrics,
 and saving results.
 """
 
+import asyncio
 import json
+import logging
+import os
 from pathlib import Path
 from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from tmf921.core import ScenarioDataset, GSTSpecification, TMF921Validator, OllamaClient
+from tmf921.core import ScenarioDataset, TMF921Validator, OllamaClient, load_gst_specification
 from tmf921.post_processing import CharacteristicNameMapper
 from tmf921.utils import load_config, compute_feaci_metrics, print_feaci_metrics
 
 
+# Supported quantization tiers (suffix of the Ollama model tag).
+# Lower precision roughly doubles throughput per halving of weight size on
+# memory-bound single-stream decoding; under high concurrency the model
+# becomes compute-bound and q5_K_M is often a better trade-off than q4_K_M.
+PRECISIONS = ("q4_K_M", "q5_K_M", "q8_0", "fp16")
+
+# Ollama options used with quantized variants to speed up prompt prefill
+QUANTIZED_MODEL_OPTIONS = {"num_ctx": 4096, "num_batch": 512}
+
+# Checkpoint serialization formats (msgpack and arrow are optional dependencies)
+CHECKPOINT_FORMATS = ("json", "msgpack", "arrow")
+
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging():
+    """
+    Show per-scenario progress on stderr unless logging is already set up.
+    
+    The level comes from the TMF921_LOG environment variable (default INFO);
+    TMF921_LOG=WARNING silences per-scenario lines for large runs.
+    """
+    logging.basicConfig(level=os.getenv("TMF921_LOG", "INFO").upper(), format="%(message)s")
+
+
+def _write_json(path: Path, obj: Any, indent: bool = False) -> None:
+    """Write obj as UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
 class BaseExperiment(ABC):
     """Abstract base class for all TMF921 intent translation experiments."""
     
@@ -30,7 +80,12 @@ class BaseExperiment(ABC):
         model_name: str,
         num_scenarios: int,
         config_path: str = "config.yaml",
-        results_dir: str = "results"
+        results_dir: str = "results",
+        pretty_final: bool = True,
+        precision: Optional[str] = None,
+        checkpoint_format: str = "json",
+        concurrency: int = 1,
+        stream_responses: bool = False
     ):
         """
         Initialize experiment.
@@ -41,12 +96,34 @@ class BaseExperiment(ABC):
             num_scenarios: Number of scenarios to process
             config_path: Path to configuration file
             results_dir: Directory to save results
+            pretty_final: Write an indented all_results.json when the run finishes
+            precision: Optional quantization tier (one of PRECISIONS); the
+                model tag "<model_name>-<precision>" is pulled once in setup()
+            checkpoint_format: Checkpoint format (one of CHECKPOINT_FORMATS);
+                binary formats are faster and smaller for very large runs
+            concurrency: Scenarios processed at once; match the Ollama
+                server's OLLAMA_NUM_PARALLEL setting (1 = sequential)
+            stream_responses: Stream LLM output and stop generation once a
+                complete JSON object has arrived
         """
+        if precision is not None and precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}'. Choose from: {PRECISIONS}")
+        if checkpoint_format not in CHECKPOINT_FORMATS:
+            raise ValueError(
+                f"Unknown checkpoint format '{checkpoint_format}'. Choose from: {CHECKPOINT_FORMATS}"
+            )
+        
         self.experiment_name = experiment_name
         self.model_name = model_name
         self.num_scenarios = num_scenarios
         self.config_path = config_path
         self.results_dir = Path(results_dir) / experiment_name
+        self.pretty_final = pretty_final
+        self.precision = precision
+        self.model_options = None
+        self.checkpoint_format = checkpoint_format
+        self.concurrency = max(1, concurrency)
+        self.stream_responses = stream_responses
         
         # Components (initialized in setup())
         self.config = None
@@ -58,16 +135,18 @@ class BaseExperiment(ABC):
         
         # Results storage
         self.results = []
+        self.feaci = None
         
     def setup(self):
         """Initialize all components."""
+        configure_logging()
         print(f"\n[1/4] Loading configuration and components...")
         
         # Load config
         self.config = load_config(self.config_path)
         
         # Load GST specification
-        self.gst = GSTSpecification("gst.json")
+        self.gst = load_gst_specification("gst.json")
         print(f"  [OK] Loaded GST specification: {self.gst.spec.get('name', 'Unknown')}")
         
         # Initialize validator
@@ -88,6 +167,10 @@ class BaseExperiment(ABC):
         if not self.client._check_connection():
             raise ConnectionError("Cannot connect to Ollama. Make sure it's running.")
         
+        if self.precision:
+            self.client.model = self.client.ensure_model(f"{self.model_name}-{self.precision}")
+            self.model_options = QUANTIZED_MODEL_OPTIONS
+        
         print(f"  [OK] Connected using model: {self.client.model}")
         
         # Create results directory
@@ -119,8 +202,7 @@ class BaseExperiment(ABC):
         Returns:
             Result dictionary
         """
-        print(f"\nScenario {idx}/{len(self.scenarios)}:")
-        print(f"  Input: {scenario[:70]}...")
+        logger.info("\nScenario %d/%d:\n  Input: %s...", idx, len(self.scenarios), scenario[:70])
         
         try:
             # Build prompt
@@ -131,14 +213,16 @@ class BaseExperiment(ABC):
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 temperature=0.1,
-                max_tokens=2048
+                max_tokens=2048,
+                stream=self.stream_responses,
+                options=self.model_options
             )
             
             # Extract JSON
             intent_json = self.client.extract_json(response['response'])
             
             if not intent_json:
-                print(f"  [FAIL] Could not extract JSON")
+                logger.info("  [FAIL] Scenario %d: could not extract JSON", idx)
                 return {
                     'scenario': scenario,
                     'generated_intent': None,
@@ -163,19 +247,19 @@ class BaseExperiment(ABC):
                 }
             }
             
-            # Print status
-            status = "[OK]" if validation['overall_valid'] else "[FAIL]"
-            print(f"  {status} Valid: {validation['overall_valid']}, "
-                  f"Corrections: {len(corrections)}, "
-                  f"Time: {response['time_seconds']:.1f}s")
-            
-            if not validation['overall_valid'] and validation['errors']:
-                print(f"    Errors: {validation['errors'][:1]}")
+            # Log status (formatted only if INFO is enabled)
+            valid = validation['overall_valid']
+            status = "  %s Scenario %d: Valid: %s, Corrections: %d, Time: %.1fs"
+            args = ["[OK]" if valid else "[FAIL]", idx, valid, len(corrections), response['time_seconds']]
+            if not valid and validation['errors']:
+                status += "\n    Errors: %s"
+                args.append(validation['errors'][:1])
+            logger.info(status, *args)
             
             return result
             
         except Exception as e:
-            print(f"  [ERROR] {str(e)[:100]}")
+            logger.warning("  [ERROR] Scenario %d: %.100s", idx, e)
             return {
                 'scenario': scenario,
                 'generated_intent': None,
@@ -187,41 +271,129 @@ class BaseExperiment(ABC):
         print(f"\n[4/4] Running {self.experiment_name} on {len(self.scenarios)} scenarios...")
         print("=" * 80)
         
-        for i, scenario in enumerate(self.scenarios, 1):
-            result = self.process_scenario(scenario, i)
-            self.results.append(result)
-            
-            # Save checkpoint every 10 scenarios
-            if i %10 == 0:
-                self.save_checkpoint(i)
+        self.prepare_run()
+        
+        if self.concurrency > 1:
+            asyncio.run(self._run_concurrent())
+        else:
+            for i, scenario in enumerate(self.scenarios, 1):
+                result = self.process_scenario(scenario, i)
+                self.results.append(result)
+                
+                # Save checkpoint every 10 scenarios
+                if i %10 == 0:
+                    self.save_checkpoint(i)
         
         # Compute and save final metrics
         self.compute_and_save_metrics()
         
+        if self.pretty_final:
+            self.save_results()
+        
         print(f"\n[SUCCESS] Experiment complete!")
         print("=" * 80 + "\n")
     
+    def prepare_run(self):
+        """Hook called by run() before the first scenario; does nothing by default."""
+    
+    async def _run_concurrent(self):
+        """Process scenarios with up to self.concurrency requests in flight."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results_by_idx = {}
+        
+        async def _one(i: int, scenario: str):
+            async with semaphore:
+                result = await asyncio.to_thread(self.process_scenario, scenario, i)
+            return i, result
+        
+        tasks = [_one(i, s) for i, s in enumerate(self.scenarios, 1)]
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            i, result = await task
+            results_by_idx[i] = result
+            
+            # Keep results in scenario order; checkpoint every 10 completions
+            if done % 10 == 0:
+                self.results = [results_by_idx[k] for k in sorted(results_by_idx)]
+                self.save_checkpoint(done)
+        
+        self.results = [results_by_idx[k] for k in sorted(results_by_idx)]
+    
+    def teardown(self):
+        """Release resources held by the experiment (pooled LLM connections)."""
+        if self.client is not None:
+            self.client.close()
+    
     def save_checkpoint(self, num_scenarios: int):
-        """Save checkpoint."""
-        checkpoint_file = self.results_dir / f"checkpoint_{num_scenarios}.json"
-        with open(checkpoint_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        """Save checkpoint (compact, written every few scenarios)."""
+        checkpoint_base = self.results_dir / f"checkpoint_{num_scenarios}"
+        
+        if self.checkpoint_format == "msgpack":
+            import msgpack
+            checkpoint_base.with_suffix(".msgpack").write_bytes(
+                msgpack.packb(self.results, use_bin_type=True)
+            )
+        elif self.checkpoint_format == "arrow":
+            from pyarrow import feather
+            feather.write_feather(self._results_table(), str(checkpoint_base.with_suffix(".arrow")))
+        else:
+            _write_json(checkpoint_base.with_suffix(".json"), self.results)
+        
         print(f"  [CHECKPOINT] Saved {num_scenarios} results")
     
+    def _results_table(self):
+        """Flatten results into a columnar pyarrow Table."""
+        import pyarrow as pa
+        
+        columns = {
+            'scenario': [], 'valid': [], 'time_seconds': [],
+            'tokens': [], 'corrections': [], 'intent_json': []
+        }
+        for r in self.results:
+            metrics = r.get('metrics', {})
+            intent = r.get('generated_intent')
+            columns['scenario'].append(r['scenario'])
+            columns['valid'].append(r.get('validation', {}).get('overall_valid', False))
+            columns['time_seconds'].append(metrics.get('time_seconds'))
+            columns['tokens'].append(metrics.get('tokens'))
+            columns['corrections'].append(len(r.get('name_corrections') or ()))
+            columns['intent_json'].append(
+                _dumps_bytes(intent) if intent is not None else None
+            )
+        
+        return pa.table({
+            'scenario': pa.array(columns['scenario'], type=pa.string()),
+            'valid': pa.array(columns['valid'], type=pa.bool_()),
+            'time_seconds': pa.array(columns['time_seconds'], type=pa.float64()),
+            'tokens': pa.array(columns['tokens'], type=pa.int64()),
+            'corrections': pa.array(columns['corrections'], type=pa.int32()),
+            'intent_json': pa.array(columns['intent_json'], type=pa.binary()),
+        })
+    
+    def save_results(self):
+        """Save the full results once, pretty-printed for inspection."""
+        results_file = self.results_dir / "all_results.json"
+        _write_json(results_file, self.results, indent=True)
+    
     def compute_and_save_metrics(self):
         """Compute FEACI metrics with full transparency and honest reporting."""
         print(f"\nComputing metrics...")
         
-        # HONEST COUNTS
+        # HONEST COUNTS (single pass over the results)
         total_scenarios = len(self.scenarios)
-        successfully_processed = len([r for r in self.results if r.get('generated_intent')])
+        successfully_processed = 0
+        valid_intents = 0  # Of successfully processed, how many are valid?
+        num_corrections = 0
+        for r in self.results:
+            if r.get('generated_intent'):
+                successfully_processed += 1
+            if r.get('validation', {}).get('overall_valid', False):
+                valid_intents += 1
+            num_corrections += len(r.get('name_corrections') or ())
         json_failures = total_scenarios - successfully_processed
         
-        # Of successfully processed, how many are valid?
-        valid_results = [r for r in self.results if r.get('validation', {}).get('overall_valid', False)]
-        
         # FEACI on successfully processed only
         feaci = compute_feaci_metrics(self.results)
+        self.feaci = feaci
         
         print("\n" + "="*80)
         print("HONEST METRICS REPORTING")
@@ -231,11 +403,11 @@ class BaseExperiment(ABC):
         print(f"Processing Failures:    {json_failures} ({json_failures/total_scenarios*100:.1f}%)")
         print(f"Successfully Processed: {successfully_processed} ({successfully_processed/total_scenarios*100:.1f}%)")
         if successfully_processed > 0:
-            print(f"Valid Intents:          {len(valid_results)} ({len(valid_results)/successfully_processed*100:.1f}% of processed)")
+            print(f"Valid Intents:          {valid_intents} ({valid_intents/successfully_processed*100:.1f}% of processed)")
         else:
-            print(f"Valid Intents:          {len(valid_results)} (N/A - no scenarios processed)")
+            print(f"Valid Intents:          {valid_intents} (N/A - no scenarios processed)")
         
-        print(f"\n**Overall Success Rate: {len(valid_results)}/{total_scenarios} = {len(valid_results)/total_scenarios*100:.1f}%**")
+        print(f"\n**Overall Success Rate: {valid_intents}/{total_scenarios} = {valid_intents/total_scenarios*100:.1f}%**")
         
         # Print FEACI metrics
         print_feaci_metrics(feaci)
@@ -244,17 +416,18 @@ class BaseExperiment(ABC):
         metrics_summary = {
             'experiment': self.experiment_name,
             'model': self.model_name,
+            'precision': self.precision,
             'honest_counts': {
                 'total_scenarios': total_scenarios,
                 'processing_failures': json_failures,
                 'processing_failure_rate': json_failures / total_scenarios,
                 'successfully_processed': successfully_processed,
                 'processing_success_rate': successfully_processed / total_scenarios,
-                'valid_intents': len(valid_results),
-                'validation_success_rate_on_processed': len(valid_results) / successfully_processed if successfully_processed > 0 else 0,
-                'overall_success_rate': len(valid_results) / total_scenarios
+                'valid_intents': valid_intents,
+                'validation_success_rate_on_processed': valid_intents / successfully_processed if successfully_processed > 0 else 0,
+                'overall_success_rate': valid_intents / total_scenarios
             },
-            'num_corrections': sum(len(r.get('name_corrections', [])) for r in self.results if r.get('name_corrections')),
+            'num_corrections': num_corrections,
             'feaci': feaci,
             'timestamp': datetime.now().isoformat()
         }
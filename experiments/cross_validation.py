@@ -9,12 +9,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import numpy as np
-from sklearn.model_selection import KFold
 import json
 from datetime import datetime
 
 from tmf921.core import ScenarioDataset
-from tmf921.utils import compute_feaci_metrics
 
 
 class CrossValidationExperiment:
@@ -71,10 +69,27 @@ class CrossValidationExperiment:
         print(f"Model: {self.model_name}")
         print("")
         
-        # K-fold split
-        kf = KFold(n_splits=self.n_folds, shuffle=True, random_state=42)
+        # K-fold split: same permutation and fold sizes as
+        # KFold(n_splits, shuffle=True, random_state=42), without importing sklearn
+        indices = np.arange(len(scenarios))
+        np.random.RandomState(42).shuffle(indices)
+        folds = np.array_split(indices, self.n_folds)
+        
+        # Create and set up the experiment once: config, GST spec, LLM client
+        # and RAG retriever are identical across folds
+        fold_size = len(folds[0])
+        if self.scenarios_per_fold:
+            fold_size = min(fold_size, self.scenarios_per_fold)
+        exp = self.experiment_class(
+            model_name=self.model_name,
+            num_scenarios=fold_size,
+            **self.experiment_kwargs
+        )
+        exp.setup()
+        base_name = exp.experiment_name
+        results_root = exp.results_dir.parent
         
-        for fold_idx, (train_idx, val_idx) in enumerate(kf.split(scenarios), 1):
+        for fold_idx, val_idx in enumerate(folds, 1):
             print(f"\n{'='*80}")
             print(f"FOLD {fold_idx}/{self.n_folds}")
             print(f"{'='*80}")
@@ -88,20 +103,17 @@ class CrossValidationExperiment:
             
             print(f"Evaluating on {len(fold_scenarios)} scenarios...")
             
-            # Create and run experiment for this fold
-            exp = self.experiment_class(
-                model_name=self.model_name,
-                num_scenarios=len(fold_scenarios),
-                **self.experiment_kwargs
-            )
-            
-            exp.setup()
+            # Point the shared experiment at this fold and run it
             exp.scenarios = fold_scenarios
-            exp.experiment_name = f"{exp.experiment_name}_fold{fold_idx}"
+            exp.num_scenarios = len(fold_scenarios)
+            exp.experiment_name = f"{base_name}_fold{fold_idx}"
+            exp.results_dir = results_root / exp.experiment_name
+            exp.results_dir.mkdir(parents=True, exist_ok=True)
+            exp.results = []
             exp.run()
             
-            # Store fold results
-            fold_metrics = compute_feaci_metrics(exp.results)
+            # Store fold results (FEACI already computed by exp.run())
+            fold_metrics = exp.feaci
             
             self.fold_results.append({
                 'fold': fold_idx,
@@ -112,6 +124,8 @@ class CrossValidationExperiment:
             
             print(f"\nFold {fold_idx} Accuracy: {fold_metrics['accuracy']:.1f}%")
         
+        exp.teardown()
+        
         # Aggregate and report
         self.aggregate_and_report()
     
@@ -16,13 +16,21 @@ from base_experiment import BaseExperiment
 class RAGCloudExperiment(BaseExperiment):
     """RAG experiment with Ollama Cloud model."""
     
-    def __init__(self, model_name: str = "gpt-oss:20b-cloud", num_scenarios: int = 50, **kwargs):
+    def __init__(
+        self,
+        model_name: str = "gpt-oss:20b-cloud",
+        num_scenarios: int = 50,
+        batch_retrieval: bool = False,
+        **kwargs
+    ):
         """
         Initialize RAG + Cloud experiment.
         
         Args:
             model_name: Name of cloud model
             num_scenarios: Number of scenarios to process
+            batch_retrieval: Retrieve for all scenarios in one batched query
+                before the run instead of one query per scenario
             **kwargs: Additional arguments for BaseExperiment
         """
         super().__init__(
@@ -33,6 +41,8 @@ class RAGCloudExperiment(BaseExperiment):
         )
         self.prompt_builder = None
         self.retriever = None
+        self.batch_retrieval = batch_retrieval
+        self._retrieved = {}
         
     def setup(self):
         """Initialize components including RAG retriever."""
@@ -45,6 +55,19 @@ class RAGCloudExperiment(BaseExperiment):
         self.retriever = GSTRetriever()
         print(f"  [OK] RAG retriever initialized")
     
+    def prepare_run(self):
+        """Batch-retrieve characteristics for every scenario if enabled."""
+        if self.batch_retrieval:
+            retrieved = self.retriever.retrieve_for_scenarios(self.scenarios, n_results=8)
+            self._retrieved = dict(zip(self.scenarios, retrieved))
+    
+    def _retrieve(self, scenario: str):
+        """Characteristics for a scenario, from the batched pre-run step if available."""
+        retrieved_chars = self._retrieved.get(scenario)
+        if retrieved_chars is None:
+            retrieved_chars = self.retriever.retrieve_for_scenario(scenario, n_results=8)
+        return retrieved_chars
+    
     def build_prompt(self, scenario: str) -> tuple[str, str]:
         """
         Build RAG-enhanced prompt.
@@ -56,7 +79,7 @@ class RAGCloudExperiment(BaseExperiment):
             Tuple of (system_prompt, user_prompt)
         """
         # Retrieve relevant characteristics
-        retrieved_chars = self.retriever.retrieve_for_scenario(scenario, n_results=8)
+        retrieved_chars = self._retrieve(scenario)
         
         # Build RAG prompt
         system_prompt = self.prompt_builder.build_system_prompt()
@@ -75,8 +98,10 @@ class RAGCloudExperiment(BaseExperiment):
         
         # Add retrieved characteristics to result
         if result.get('generated_intent'):
-            retrieved_chars = self.retriever.retrieve_for_scenario(scenario, n_results=8)
-            result['retrieved_characteristics'] = [c['name'] for c in retrieved_chars]
+            retrieved_chars = self._retrieve(scenario)
+            # Names repeat across scenarios; intern them so every result
+            # shares one string object per characteristic
+            result['retrieved_characteristics'] = [sys.intern(c.name) for c in retrieved_chars]
             
             # Update print output
             if idx <= len(self.scenarios):
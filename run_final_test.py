@@ -5,6 +5,7 @@ Run final test set evaluation.
 This should only be run once for final publication numbers.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -15,6 +16,9 @@ sys.path.insert(0, str(Path(__file__).parent / "experiments"))
 from tmf921.core import ScenarioDataset
 from rag_cloud import RAGCloudExperiment
 
+# Concurrent LLM requests; match the server's parallel slots (default 4)
+CONCURRENCY = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
 def main():
     print("\n" + "="*80)
     print("⚠️  FINAL TEST SET EVALUATION - ONE-TIME USE ONLY")
@@ -28,7 +32,9 @@ def main():
     # Create experiment with test set name
     experiment = RAGCloudExperiment(
         model_name="llama3:8b",
-        num_scenarios=87
+        num_scenarios=87,
+        batch_retrieval=True,
+        concurrency=CONCURRENCY
     )
     
     # Override experiment name for test set
@@ -46,22 +52,8 @@ def main():
     print("This will take approximately 3-4 minutes...\n")
     
     # Run without calling setup again
-    print(f"\n[4/4] Running {experiment.experiment_name} on {len(experiment.scenarios)} scenarios...")
-    print("=" * 80)
-    
-    for i, scenario in enumerate(experiment.scenarios, 1):
-        result = experiment.process_scenario(scenario, i)
-        experiment.results.append(result)
-        
-        # Save checkpoint every 10 scenarios
-        if i % 10 == 0:
-            experiment.save_checkpoint(i)
-    
-    # Compute and save final metrics
-    experiment.compute_and_save_metrics()
-    
-    print(f"\n[SUCCESS] Experiment complete!")
-    print("=" * 80 + "\n")
+    experiment.run()
+    experiment.teardown()
     
     print("\n" + "="*80)
     print("✓ FINAL TEST SET EVALUATION COMPLETE")
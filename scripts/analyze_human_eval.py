@@ -33,6 +33,6 @@ print("="*80)
 comparison = suite.compare_automated_vs_human(df)
 
 # Save results
-suite.save_human_eval_results(df, output_dir="results/human_evaluation")
+suite.save_human_eval_results(df, output_dir="results/human_evaluation", comparison=comparison)
 
 print("\n[OK] Analysis complete! Check results/human_evaluation/")
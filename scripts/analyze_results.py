@@ -8,55 +8,83 @@ Usage:
 
 import argparse
 import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+_RULE = "=" * 80
+
+# Single-experiment report, filled from the metrics summary with format_map
+_REPORT_TEMPLATE = (
+    f"\n{_RULE}\n"
+    "Experiment: {experiment}\n"
+    f"{_RULE}\n"
+    "\nModel: {model}\n"
+    "Scenarios: {num_scenarios}\n"
+    "Successful: {num_successful}\n"
+    "Corrections: {num_corrections}\n"
+    "\nFEACI Metrics:\n"
+    "  Format Correctness: {format_correctness:.1f}%\n"
+    "  Accuracy:           {accuracy:.1f}%\n"
+    "  Avg Tokens:         {cost_avg_tokens:.0f}\n"
+    "  Total Tokens:       {cost_total_tokens:,}\n"
+    "  Avg Time:           {inference_time_avg_seconds:.1f}s\n"
+    "  Total Time:         {total_time_min:.1f} min\n"
+    f"\n{_RULE}\n\n"
+)
+
+
+def metrics_path(experiment_name: str) -> Path:
+    """Path of an experiment's metrics summary."""
+    return Path("results") / experiment_name / "metrics_summary.json"
+
+
+@lru_cache(maxsize=128)
 def load_metrics(experiment_name: str) -> Dict[str, Any]:
-    """Load metrics from experiment results."""
-    metrics_file = Path("results") / experiment_name / "metrics_summary.json"
+    """Load metrics from experiment results (parsed once per experiment)."""
+    metrics_file = metrics_path(experiment_name)
     
     if not metrics_file.exists():
         raise FileNotFoundError(f"Metrics not found: {metrics_file}")
     
-    with open(metrics_file) as f:
-        return json.load(f)
+    data = metrics_file.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def print_experiment_results(experiment_name: str):
     """Print detailed results for single experiment."""
     metrics = load_metrics(experiment_name)
     
-    print("\n" + "="*80)
-    print(f"Experiment: {experiment_name}")
-    print("="*80)
-    
-    print(f"\nModel: {metrics['model']}")
-    print(f"Scenarios: {metrics['num_scenarios']}")
-    print(f"Successful: {metrics['num_successful']}")
-    print(f"Corrections: {metrics['num_corrections']}")
-    
     feaci = metrics['feaci']
-    print(f"\nFEACI Metrics:")
-    print(f"  Format Correctness: {feaci['format_correctness']:.1f}%")
-    print(f"  Accuracy:           {feaci['accuracy']:.1f}%")
-    print(f"  Avg Tokens:         {feaci['cost_avg_tokens']:.0f}")
-    print(f"  Total Tokens:       {feaci.get('cost_total_tokens', 0):,}")
-    print(f"  Avg Time:           {feaci['inference_time_avg_seconds']:.1f}s")
-    print(f"  Total Time:         {feaci.get('inference_time_total_seconds', 0)/60:.1f} min")
     
-    print("\n" + "="*80 + "\n")
+    # Render the whole report from one template and write it in one call
+    sys.stdout.write(_REPORT_TEMPLATE.format_map({
+        **feaci,
+        'experiment': experiment_name,
+        'model': metrics['model'],
+        'num_scenarios': metrics['num_scenarios'],
+        'num_successful': metrics['num_successful'],
+        'num_corrections': metrics['num_corrections'],
+        'cost_total_tokens': feaci.get('cost_total_tokens', 0),
+        'total_time_min': feaci.get('inference_time_total_seconds', 0) / 60,
+    }))
 
 
 def compare_experiments(experiment_names: List[str]):
     """Compare multiple experiments."""
     experiments = []
     for name in experiment_names:
-        try:
-            metrics = load_metrics(name)
-            experiments.append((name, metrics))
-        except FileNotFoundError as e:
-            print(f"Warning: {e}")
+        if not metrics_path(name).is_file():
+            print(f"Warning: Metrics not found: {metrics_path(name)}")
+            continue
+        experiments.append((name, load_metrics(name)))
     
     if not experiments:
         print("No experiments to compare")
@@ -66,17 +94,21 @@ def compare_experiments(experiment_names: List[str]):
     print("EXPERIMENT COMPARISON")
     print("="*80 + "\n")
     
-    # Print comparison table
-    print(f"{'Experiment':<30} {'Model':<20} {'Accuracy':<12} {'Time/Scenario':<15}")
-    print("-" * 80)
+    # Build the comparison table and print it in one write
+    rows = [
+        f"{'Experiment':<30} {'Model':<20} {'Accuracy':<12} {'Time/Scenario':<15}",
+        "-" * 80,
+    ]
     
     for name, metrics in experiments:
         feaci = metrics['feaci']
-        model = metrics['model']
         accuracy = feaci['accuracy']
         avg_time = feaci['inference_time_avg_seconds']
+        model = metrics['model']
         
-        print(f"{name:<30} {model:<20} {accuracy:>6.1f}%      {avg_time:>6.1f}s")
+        rows.append(f"{name:<30} {model:<20} {accuracy:>6.1f}%      {avg_time:>6.1f}s")
+    
+    print("\n".join(rows))
     
     print("\n" + "="*80 + "\n")
 
@@ -106,13 +138,14 @@ def main():
     
     # List results
     if args.list:
-        results_dir = Path("results")
-        if results_dir.exists():
-            experiments = [d.name for d in results_dir.iterdir() if d.is_dir()]
-            print("\nAvailable results:")
-            for exp in sorted(experiments):
-                print(f"  - {exp}")
-            print()
+        # scandir entries carry their file type, so no extra stat per entry
+        try:
+            with os.scandir("results") as entries:
+                experiments = sorted(e.name for e in entries if e.is_dir())
+        except FileNotFoundError:
+            return
+        print("\nAvailable results:")
+        print("".join(f"  - {exp}\n" for exp in experiments))
         return
     
     # Analyze single experiment
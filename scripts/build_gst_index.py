@@ -0,0 +1,45 @@
+"""
+Export the GST characteristic index for fast retriever startup.
+
+Dumps the embeddings (L2-normalized float32) and metadata from the ChromaDB
+collection to gst_index/. GSTRetriever memory-maps these files when they
+exist and skips opening ChromaDB. The export records the GST spec hash;
+after setup_rag.py rebuilds the collection for a changed spec, retrievers
+ignore the stale export (with a warning) until this is re-run.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tmf921.rag import GSTRetriever
+
+
+def main():
+    """Export the ChromaDB collection to an on-disk matrix."""
+    parser = argparse.ArgumentParser(description="Export GST embeddings for fast retrieval")
+    parser.add_argument("--db-path", default="chroma_db", help="ChromaDB directory")
+    parser.add_argument("--collection", default="gst_characteristics", help="Collection name")
+    parser.add_argument("--output", default="gst_index", help="Output directory")
+    args = parser.parse_args()
+    
+    print("\n" + "="*80)
+    print("TMF921 GST Index Export")
+    print("="*80 + "\n")
+    
+    # index_dir=None: always read from ChromaDB, never from a previous export
+    retriever = GSTRetriever(
+        db_path=args.db_path,
+        collection_name=args.collection,
+        index_dir=None
+    )
+    out = retriever.export_index(args.output)
+    n_chars, dims = retriever.index_shape
+    
+    print(f"  [OK] Exported {n_chars} characteristics ({dims} dims) to {out}/")
+    print("\n" + "="*80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from tmf921.evaluation.human_eval import HumanEvaluationSuite
 
 print("="*80)
@@ -24,10 +35,16 @@ if not results_file.exists():
     print("Run validation experiment first!")
     sys.exit(1)
 
-with open(results_file) as f:
-    results = json.load(f)
-
-print(f"\n[OK] Loaded {len(results)} results from validation experiment")
+if ijson is not None:
+    # Stream the results array; only the sampled entries stay in memory
+    results_fh = open(results_file, 'rb')
+    results = ijson.items(results_fh, 'item', use_float=True)
+    print(f"\n[OK] Streaming results from validation experiment")
+else:
+    results_fh = None
+    data = results_file.read_bytes()
+    results = orjson.loads(data) if orjson is not None else json.loads(data)
+    print(f"\n[OK] Loaded {len(results)} results from validation experiment")
 
 # Create human evaluation suite
 suite = HumanEvaluationSuite(sample_size=50)  # Sample 50 for review
@@ -35,6 +52,8 @@ suite = HumanEvaluationSuite(sample_size=50)  # Sample 50 for review
 # Prepare evaluation template
 print("\nPreparing evaluation template...")
 df = suite.prepare_eval_set(results, output_file="human_evaluation_template.csv")
+if results_fh is not None:
+    results_fh.close()
 
 print("\n" + "="*80)
 print("NEXT STEPS FOR SEMANTIC EVALUATION")
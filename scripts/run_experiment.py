@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import importlib
 import sys
 from pathlib import Path
 
@@ -16,20 +17,19 @@ parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir / "src"))
 sys.path.insert(0, str(parent_dir / "experiments"))
 
-from few_shot import FewShotExperiment
-from rag_cloud import RAGCloudExperiment
 
-
-# Registry of available experiments
+# Registry of available experiments. Classes are given as (module, name) and
+# imported only when that experiment runs, so --list and few_shot runs never
+# load the RAG stack.
 EXPERIMENTS = {
     "few_shot": {
-        "class": FewShotExperiment,
+        "class": ("few_shot", "FewShotExperiment"),
         "description": "Few-shot learning with example scenarios",
         "default_model": "llama3:latest",
         "default_scenarios": 10,
     },
     "rag_cloud": {
-        "class": RAGCloudExperiment,
+        "class": ("rag_cloud", "RAGCloudExperiment"),
         "description": "RAG with Ollama Cloud model for speed and accuracy",
         "default_model": "gpt-oss:20b-cloud",
         "default_scenarios": 50,
@@ -67,7 +67,8 @@ def run_experiment(experiment_name: str, model: str = None, scenarios: int = Non
         return
     
     exp_info = EXPERIMENTS[experiment_name]
-    exp_class = exp_info["class"]
+    module_name, class_name = exp_info["class"]
+    exp_class = getattr(importlib.import_module(module_name), class_name)
     
     # Use defaults if not specified
     model = model or exp_info["default_model"]
@@ -88,11 +89,22 @@ def run_experiment(experiment_name: str, model: str = None, scenarios: int = Non
     )
     
     experiment.setup()
-    experiment.run()
+    try:
+        experiment.run()
+    finally:
+        experiment.teardown()
 
 
 def main():
     """Main entry point."""
+    # Fast path: listing needs neither the parser nor any experiment imports
+    # (--list wins over every other flag, as it does after parsing)
+    if any(arg in ("--list", "-l") for arg in sys.argv[1:]):
+        list_experiments()
+        return
+    
+    from base_experiment import PRECISIONS
+    
     parser = argparse.ArgumentParser(
         description="TMF921 Intent Translation - Unified Experiment Runner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -132,6 +144,25 @@ Examples:
         help="List all available experiments"
     )
     
+    parser.add_argument(
+        "--precision",
+        choices=PRECISIONS,
+        help="Quantized model variant to pull and use (e.g. q4_K_M)"
+    )
+    
+    parser.add_argument(
+        "--concurrency", "-j",
+        type=int,
+        default=1,
+        help="Scenarios processed concurrently; set to the server's OLLAMA_NUM_PARALLEL"
+    )
+    
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses and stop generation once the intent JSON is complete"
+    )
+    
     # Few-shot specific
     parser.add_argument(
         "--examples",
@@ -153,6 +184,12 @@ Examples:
     
     # Build kwargs for experiment-specific args
     kwargs = {}
+    if args.precision:
+        kwargs["precision"] = args.precision
+    if args.concurrency > 1:
+        kwargs["concurrency"] = args.concurrency
+    if args.stream:
+        kwargs["stream_responses"] = True
     if args.experiment == "few_shot":
         kwargs["num_examples"] = args.examples
     
@@ -32,6 +32,7 @@ def main():
     
     print("\n" + "="*80)
     print("Setup complete! RAG is ready to use.")
+    print("Optional: run scripts/build_gst_index.py for faster retriever startup.")
     print("="*80 + "\n")
 
 
@@ -1,30 +1,42 @@
 """TMF921 Intent Translation - Research Experimentation Suite."""
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "TMF921 Research Team"
 
-# Export main APIs
-from .core import ScenarioDataset, GSTSpecification, TMF921Validator, OllamaClient
-from .prompting import TMF921PromptBuilder, EXAMPLE_SCENARIOS
-from .rag import GSTIndexer, GSTRetriever
-from .post_processing import CharacteristicNameMapper
-from .utils import load_config, compute_feaci_metrics
-
-__all__ = [
+# Export main APIs. Submodules are imported on first attribute access
+# (PEP 562), so importing the package does not pull in requests, yaml,
+# pydantic or the RAG stack until they are actually used.
+_LAZY = {
     # Core
-    "ScenarioDataset",
-    "GSTSpecification", 
-    "TMF921Validator",
-    "OllamaClient",
+    "ScenarioDataset": "tmf921.core",
+    "GSTSpecification": "tmf921.core",
+    "TMF921Validator": "tmf921.core",
+    "OllamaClient": "tmf921.core",
     # Prompting
-    "TMF921PromptBuilder",
-    "EXAMPLE_SCENARIOS",
+    "TMF921PromptBuilder": "tmf921.prompting",
+    "EXAMPLE_SCENARIOS": "tmf921.prompting",
     # RAG
-    "GSTIndexer",
-    "GSTRetriever",
+    "GSTIndexer": "tmf921.rag",
+    "GSTRetriever": "tmf921.rag",
     # Post-processing
-    "CharacteristicNameMapper",
+    "CharacteristicNameMapper": "tmf921.post_processing",
     # Utils
-    "load_config",
-    "compute_feaci_metrics",
-]
+    "load_config": "tmf921.utils",
+    "compute_feaci_metrics": "tmf921.utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
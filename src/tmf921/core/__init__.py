@@ -1,13 +1,29 @@
 """Core functionality: data processing, schema validation, LLM clients."""
 
-from .data_processor import ScenarioDataset, GSTSpecification
-from .schema import TMF921Validator, TMF921Intent
-from .client import OllamaClient
-
-__all__ = [
-    "ScenarioDataset",
-    "GSTSpecification",
-    "TMF921Validator",
-    "TMF921Intent",
-    "OllamaClient",
-]
+import importlib
+
+# Exports are imported on first access (PEP 562): the LLM client pulls in
+# requests and the validator pydantic, which data-only callers skip
+_LAZY = {
+    "ScenarioDataset": ".data_processor",
+    "GSTSpecification": ".data_processor",
+    "load_gst_specification": ".data_processor",
+    "TMF921Validator": ".schema",
+    "TMF921Intent": ".schema",
+    "OllamaClient": ".client",
+    "get_client": ".client",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
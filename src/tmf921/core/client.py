@@ -4,39 +4,212 @@ Ollama LLM client for TMF921 intent translation.
 Provides unified interface to local Ollama models.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
+import re
+import sqlite3
 import requests
-from typing import Dict, Any, List, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential
-import yaml
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List, Optional, Tuple
+import threading
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# JSON object inside a ``` / ```json fenced block
+_FENCE_RE = re.compile(r"```(?:json|javascript|js)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+
+# Parses the first complete JSON value starting at a given index
+_DECODER = json.JSONDecoder()
+
+# orjson.JSONDecodeError subclasses ValueError, like json's
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+_encoding = None
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Token count for text when Ollama does not report one.
+    
+    Uses tiktoken's cl100k_base encoding when installed (not the model's
+    own tokenizer, but far closer than a character ratio), else len // 4.
+    """
+    global _encoding, tiktoken
+    if tiktoken is not None:
+        try:
+            if _encoding is None:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            return len(_encoding.encode(text, disallowed_special=()))
+        except Exception:
+            tiktoken = None  # Encoding unavailable (e.g. offline): stop trying
+    return len(text) // 4
+
+
+def _retry(attempts: int = 3, max_wait: float = 10.0):
+    """
+    Retry a call on network errors with exponential backoff (2s, 4s, ...).
+    
+    Only OSError and its subclasses are retried (requests exceptions,
+    timeouts, refused connections); anything else is a bug and propagates.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return fn(*args, **kwargs)
+                except OSError:
+                    if attempt == attempts:
+                        raise
+                    time.sleep(min(max_wait, 2 ** attempt))
+        return wrapper
+    return decorator
+
+
+def _request_key(payload: Dict[str, Any]) -> str:
+    """Stable fingerprint of a chat request (model, messages and options)."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class _ResponseCache:
+    """
+    Exact-match response cache, optionally persisted to SQLite.
+    
+    Entries live in memory for the client's lifetime; with a path they are
+    also written to disk so reruns of an experiment reuse them.
+    """
+    
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite file to persist entries to (in-memory only if None)
+            ttl: Maximum age in seconds of persisted entries (None = no expiry)
+        """
+        self.ttl = ttl
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            self._db.commit()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None or self._db is None:
+                return entry
+            row = self._db.execute(
+                "SELECT response, ts FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return None
+        entry = _loads(row[0])
+        with self._lock:
+            self._memory[key] = entry
+        return entry
+    
+    def put(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = entry
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                    (key, json.dumps(entry), time.time())
+                )
+                self._db.commit()
+    
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
 
 class OllamaClient:
     """Client for interacting with local Ollama LLMs."""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "llama3.1:8b",
+        enable_cache: bool = False,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None
+    ):
         """
         Initialize Ollama client.
         
         Args:
             base_url: Ollama API endpoint
             model: Model name (e.g., "llama3.1:8b", "phi3:mini", "gemma2:9b")
+            enable_cache: Reuse responses for byte-identical requests
+                (same model, prompts and options) instead of calling the LLM
+            cache_path: SQLite file that persists the cache across runs
+                (implies enable_cache)
+            cache_ttl: Seconds after which persisted responses are ignored
         """
         self.base_url = base_url.rstrip('/')
         self.model = model
         self.total_tokens = 0
         self.total_time = 0.0  # seconds
+        # Guards the running totals when generate() is called from threads
+        self._stats_lock = threading.Lock()
+        
+        # Persistent keep-alive session so every request reuses the same
+        # TCP connection instead of paying a new handshake per scenario
+        self._session = requests.Session()
+        # Default pool keeps only 10 connections per host; size it for
+        # concurrent generate() calls so sockets are not dropped and reopened
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # Server reachability is checked once, not before every request
+        self._conn_verified = False
+        
+        # Exact-match response cache (opt-in): request fingerprint -> result
+        self._cache = None
+        if enable_cache or cache_path is not None:
+            self._cache = _ResponseCache(cache_path, cache_ttl)
+        
+    def close(self):
+        """Close pooled HTTP connections and the response cache."""
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def _check_connection(self) -> bool:
         """Check if Ollama is running."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
+            self._conn_verified = response.status_code == 200
+            return self._conn_verified
         except:
             return False
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_retry(attempts=3)
     def generate(
         self, 
         prompt: str,
@@ -44,7 +217,8 @@ class OllamaClient:
         temperature: float = 0.1,
         max_tokens: int = 4096,
         top_p: float = 0.9,
-        stream: bool = False
+        stream: bool = False,
+        options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate completion from Ollama model.
@@ -55,7 +229,9 @@ class OllamaClient:
             temperature: Sampling temperature (0.0 = deterministic)
             max_tokens: Maximum tokens to generate
             top_p: Nuclear sampling parameter
-            stream: Whether to stream response
+            stream: Stream the response and stop as soon as it contains a
+                complete JSON object (token counts are then estimated)
+            options: Extra Ollama model options (e.g. num_ctx, num_batch)
             
         Returns:
             {
@@ -64,13 +240,9 @@ class OllamaClient:
                 'time_seconds': float,
                 'model': str
             }
+            Cache hits return the stored result with 'cached': True and do
+            not add to the running totals.
         """
-        if not self._check_connection():
-            raise ConnectionError(
-                f"Cannot connect to Ollama at {self.base_url}. "
-                "Please ensure Ollama is running: 'ollama serve'"
-            )
-        
         # Build messages
         messages = []
         if system_prompt:
@@ -88,37 +260,68 @@ class OllamaClient:
                 "top_p": top_p,
             }
         }
+        if options:
+            payload["options"].update(options)
         
-        # Time the request
-        start_time = time.time()
+        cache_key = None
+        if self._cache is not None:
+            cache_key = _request_key(payload)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return {**cached, 'cached': True}
         
-        response = requests.post(
-            f"{self.base_url}/api/chat",
-            json=payload,
-            timeout=120
-        )
+        if not self._conn_verified and not self._check_connection():
+            raise ConnectionError(
+                f"Cannot connect to Ollama at {self.base_url}. "
+                "Please ensure Ollama is running: 'ollama serve'"
+            )
         
-        end_time = time.time()
-        elapsed = end_time - start_time
+        # Time the request
+        start_time = time.perf_counter()
+        
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/chat",
+                json=payload,
+                timeout=120,
+                stream=stream
+            )
+        except requests.exceptions.ConnectionError:
+            # Server went away: re-check before the retry
+            self._conn_verified = False
+            raise
         
         if response.status_code != 200:
-            raise Exception(f"Ollama API error: {response.text}")
+            raise requests.exceptions.HTTPError(
+                f"Ollama API error: {response.text}", response=response
+            )
         
-        result = response.json()
+        if stream:
+            response_text, result = self._read_stream(response)
+        else:
+            result = _loads(response.content)
+            
+            # Extract response text
+            response_text = result.get('message', {}).get('content', '')
         
-        # Extract response text
-        response_text = result.get('message', {}).get('content', '')
+        end_time = time.perf_counter()
+        elapsed = end_time - start_time
         
         # Token counting (approximate - Ollama doesn't always provide exact counts)
-        prompt_tokens = result.get('prompt_eval_count', len(prompt) // 4)
-        completion_tokens = result.get('eval_count', len(response_text) // 4)
+        prompt_tokens = result.get('prompt_eval_count')
+        if prompt_tokens is None:
+            prompt_tokens = _estimate_tokens(prompt)
+        completion_tokens = result.get('eval_count')
+        if completion_tokens is None:
+            completion_tokens = _estimate_tokens(response_text)
         total_tokens = prompt_tokens + completion_tokens
         
         # Update totals
-        self.total_tokens += total_tokens
-        self.total_time += elapsed
+        with self._stats_lock:
+            self.total_tokens += total_tokens
+            self.total_time += elapsed
         
-        return {
+        output = {
             'response': response_text,
             'tokens': total_tokens,
             'prompt_tokens': prompt_tokens,
@@ -126,6 +329,104 @@ class OllamaClient:
             'time_seconds': elapsed,
             'model': self.model
         }
+        
+        if cache_key is not None:
+            self._cache.put(cache_key, dict(output))
+        
+        return output
+    
+    def _read_stream(self, response: requests.Response) -> Tuple[str, Dict[str, Any]]:
+        """
+        Read a streamed chat response, stopping once a JSON object is complete.
+        
+        Closing the connection early makes Ollama stop generating, so the
+        trailing prose after the intent JSON is never produced.
+        
+        Args:
+            response: Streaming /api/chat response (NDJSON lines)
+            
+        Returns:
+            Tuple of (response text, last message received)
+        """
+        chunks = []
+        message = {}
+        start_idx = -1  # Offset of the first '{' in the joined text
+        length = 0
+        try:
+            # Each NDJSON line is decoded once from bytes; the accumulated
+            # text is only re-parsed when a chunk could close the object
+            for line in response.iter_lines(decode_unicode=False):
+                if not line:
+                    continue
+                message = _loads(line)
+                piece = message.get('message', {}).get('content', '')
+                chunks.append(piece)
+                if message.get('done'):
+                    break
+                
+                if start_idx == -1:
+                    pos = piece.find('{')
+                    if pos != -1:
+                        start_idx = length + pos
+                length += len(piece)
+                
+                if start_idx == -1 or '}' not in piece:
+                    continue
+                try:
+                    _DECODER.raw_decode(''.join(chunks), start_idx)
+                except ValueError:
+                    continue
+                break
+        finally:
+            response.close()
+        
+        return ''.join(chunks), message
+    
+    async def agenerate(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Async variant of generate().
+        
+        The blocking request runs in a worker thread on the pooled session,
+        so several calls can be in flight at once.
+        
+        Args:
+            prompt: User prompt
+            **kwargs: Same keyword arguments as generate()
+            
+        Returns:
+            Same dict as generate()
+        """
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
+    
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 4,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate completions for several prompts concurrently.
+        
+        Set concurrency to the server's OLLAMA_NUM_PARALLEL; more in-flight
+        requests than that just queue on the Ollama side.
+        
+        Args:
+            prompts: User prompts
+            system_prompt: Optional system prompt shared by all prompts
+            concurrency: Maximum number of requests in flight
+            **kwargs: Extra keyword arguments for generate()
+            
+        Returns:
+            One generate() result per prompt, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.agenerate(prompt, system_prompt=system_prompt, **kwargs)
+        
+        return await asyncio.gather(*(_one(p) for p in prompts))
     
     def extract_json(self, response_text: str) -> Optional[Dict[str, Any]]:
         """
@@ -141,51 +442,27 @@ class OllamaClient:
         """
         # Try direct JSON parse first
         try:
-            return json.loads(response_text)
-        except:
+            return _loads(response_text)
+        except ValueError:
             pass
         
-        # Try extracting from ```json ... ``` blocks
-        if "```json" in response_text:
+        # Try extracting from ```json ... ``` (or plain ```) blocks
+        match = _FENCE_RE.search(response_text)
+        if match:
             try:
-                start_idx = response_text.find("```json") + 7
-                end_idx = response_text.find("```", start_idx)
-                json_str = response_text[start_idx:end_idx].strip()
-                return json.loads(json_str)
-            except:
+                return _loads(match.group(1))
+            except ValueError:
                 pass
         
-        # Try extracting from ``` ... ``` blocks (no language specified)
-        if "```" in response_text:
+        # Parse the first JSON object in the text; raw_decode stops at its
+        # closing brace and ignores whatever follows
+        start_idx = response_text.find('{')
+        if start_idx != -1:
             try:
-                start_idx = response_text.find("```") + 3
-                end_idx = response_text.find("```", start_idx)
-                json_str = response_text[start_idx:end_idx].strip()
-                # Remove potential language identifier on first line
-                lines = json_str.split('\\n')
-                if lines[0].strip().lower() in ['json', 'javascript', 'js']:
-                    json_str = '\\n'.join(lines[1:])
-                return json.loads(json_str)
-            except:
+                return _DECODER.raw_decode(response_text, start_idx)[0]
+            except ValueError:
                 pass
         
-        # Try finding JSON object boundaries
-        try:
-            start_idx = response_text.find('{')
-            if start_idx != -1:
-                # Find matching closing brace
-                brace_count = 0
-                for i in range(start_idx, len(response_text)):
-                    if response_text[i] == '{':
-                        brace_count += 1
-                    elif response_text[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_str = response_text[start_idx:i+1]
-                            return json.loads(json_str)
-        except:
-            pass
-        
         return None
     
     def get_stats(self) -> Dict[str, Any]:
@@ -197,10 +474,34 @@ class OllamaClient:
             'model': self.model
         }
     
+    def ensure_model(self, model: str) -> str:
+        """
+        Make sure a model is available locally, pulling it once if needed.
+        
+        Args:
+            model: Model tag (e.g., "llama3:8b-instruct-q4_K_M")
+            
+        Returns:
+            The model tag
+        """
+        if model in self.list_models():
+            return model
+        
+        print(f"  Pulling model {model} (one-time download)...")
+        response = self._session.post(
+            f"{self.base_url}/api/pull",
+            json={"model": model, "stream": False},
+            timeout=None
+        )
+        if response.status_code != 200:
+            raise Exception(f"Ollama pull error for {model}: {response.text}")
+        
+        return model
+    
     def list_models(self) -> List[str]:
         """List available Ollama models."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 return [m.get('name') for m in models]
@@ -209,6 +510,24 @@ class OllamaClient:
             return []
 
 
+@functools.lru_cache(maxsize=4)
+def get_client(base_url: str = "http://localhost:11434", model: str = "llama3.1:8b") -> OllamaClient:
+    """
+    Shared OllamaClient per (base_url, model).
+    
+    Repeated calls return the same client, so its connection pool, response
+    cache and token counters carry over between experiment stages.
+    
+    Args:
+        base_url: Ollama API endpoint
+        model: Model name
+        
+    Returns:
+        Cached OllamaClient
+    """
+    return OllamaClient(base_url=base_url, model=model)
+
+
 def load_llm_client(config_path: str = "config.yaml", model_alias: Optional[str] = None) -> OllamaClient:
     """
     Load LLM client from configuration.
@@ -218,10 +537,11 @@ def load_llm_client(config_path: str = "config.yaml", model_alias: Optional[str]
         model_alias: Optional model alias (e.g., "llama-3.1-8b")  
         
     Returns:
-        Configured OllamaClient
+        Configured OllamaClient (shared with other callers, see get_client)
     """
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    from ..utils.config import load_config
+    
+    config = load_config(config_path)
     
     ollama_config = config['models']['ollama']
     base_url = ollama_config['base_url']
@@ -241,7 +561,7 @@ def load_llm_client(config_path: str = "config.yaml", model_alias: Optional[str]
             # Fallback to gemma:2b
             model_name = "gemma:2b"
     
-    return OllamaClient(base_url=base_url, model=model_name)
+    return get_client(base_url, model_name)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,20 @@ Handles loading, analyzing, and splitting the scenarios dataset and GST specific
 """
 
 import json
+import os
+import pickle
 import random
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from collections import Counter
+from functools import lru_cache
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ScenarioDataset:
     """Load and manage the 456 telecom scenarios."""
@@ -20,12 +28,47 @@ class ScenarioDataset:
         self.scenarios = self._load_scenarios()
         
     def _load_scenarios(self) -> List[str]:
-        """Load scenarios from JSON file."""
-        with open(self.scenarios_path, 'r', encoding='utf-8') as f:
-            scenarios = json.load(f)
+        """
+        Load scenarios from JSON file.
+        
+        The parsed list is cached next to the JSON as ``<name>.pkl``, tagged
+        with the JSON's size and mtime, and reused only while both match.
+        """
+        cache_path = self.scenarios_path.with_name(self.scenarios_path.name + '.pkl')
+        stat = self.scenarios_path.stat()
+        source = (stat.st_size, stat.st_mtime_ns)
+        
+        scenarios = None
+        if cache_path.is_file():
+            try:
+                cached = pickle.loads(cache_path.read_bytes())
+            except (pickle.UnpicklingError, EOFError, ValueError):
+                cached = None  # Truncated cache file, rebuild it below
+            if isinstance(cached, dict) and cached.get('source') == source:
+                scenarios = cached.get('scenarios')
+        
+        if scenarios is None:
+            data = self.scenarios_path.read_bytes()
+            scenarios = orjson.loads(data) if orjson is not None else json.loads(data)
+            self._write_cache(cache_path, {'source': source, 'scenarios': scenarios})
+        
         print(f"[OK] Loaded {len(scenarios)} scenarios from {self.scenarios_path}")
         return scenarios
     
+    @staticmethod
+    def _write_cache(cache_path: Path, payload: Dict[str, Any]) -> None:
+        """Write the pickle cache atomically so readers never see a partial file."""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only data directory or full disk, just skip caching
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
     def analyze(self) -> Dict[str, Any]:
         """Analyze dataset characteristics."""
         stats = {
@@ -147,6 +190,30 @@ class GSTSpecification:
         return schema
 
 
+@lru_cache(maxsize=4)
+def _load_gst_cached(gst_path: str, mtime_ns: int) -> GSTSpecification:
+    """Parse a GST specification; mtime_ns only keys the cache."""
+    return GSTSpecification(gst_path)
+
+
+def load_gst_specification(gst_path: str = "gst.json") -> GSTSpecification:
+    """
+    Load a GST specification, sharing one parsed instance per file.
+    
+    Repeated loads of an unchanged file (e.g. several experiments in one
+    process) return the same object; editing the file invalidates it.
+    The returned instance is shared and must not be modified.
+    
+    Args:
+        gst_path: Path to GST specification JSON
+        
+    Returns:
+        Parsed GSTSpecification
+    """
+    path = os.path.abspath(gst_path)
+    return _load_gst_cached(path, os.stat(path).st_mtime_ns)
+
+
 def main():
     """Run data analysis."""
     print("\n" + "="*60)
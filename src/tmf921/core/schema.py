@@ -4,10 +4,17 @@ TMF921 Intent schema definition and validation utilities.
 Based on TMF921 Intent Management API specification.
 """
 
+import sys
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 
 class IntentType(str, Enum):
     """TMF921 Intent types."""
@@ -65,6 +72,86 @@ class TMF921Intent(BaseModel):
     
     class Config:
         use_enum_values = True
+    
+    @classmethod
+    def from_validated_dict(cls, intent_dict: Dict[str, Any]) -> "TMF921Intent":
+        """
+        Build an intent without running pydantic validation.
+        
+        Only for dicts that already passed TMF921Validator.validate_format;
+        anything else produces a model with unchecked fields.
+        
+        Args:
+            intent_dict: Intent dict accepted by validate_format
+            
+        Returns:
+            TMF921Intent with nested characteristics constructed as models
+        """
+        chars = []
+        for char in intent_dict.get('serviceSpecCharacteristic', []):
+            value = char.get('value')
+            if isinstance(value, dict):
+                value = ServiceCharacteristicValue.model_construct(**value)
+            chars.append(ServiceCharacteristic.model_construct(**{**char, 'value': value}))
+        return cls.model_construct(**{**intent_dict, 'serviceSpecCharacteristic': chars})
+
+
+# Common unit spellings accepted as equivalent to the GST unit of measure
+UNIT_VARIATIONS = MappingProxyType({
+    'percent': '%',
+    'percentage': '%',
+    'milliseconds': 'ms',
+    'msec': 'ms',
+    'millisecond': 'ms'
+})
+
+# Lowercased units whose values are percentages
+_PERCENT_UNITS = frozenset(['%', 'percent', 'percentage'])
+
+
+def _normalize_unit(unit: str) -> str:
+    """Lowercase a unit and map known variations to their canonical form."""
+    unit_lower = unit.lower()
+    return UNIT_VARIATIONS.get(unit_lower, unit_lower)
+
+
+# Name-based characteristic classes used by the constraint and plausibility
+# checks, combined as bit flags
+_THROUGHPUT = 1     # 'throughput' / 'bandwidth'
+_DELAY = 2          # 'latency' / 'delay'
+_COUNT = 4          # 'number' / 'count' / 'density'
+_LATENCY = 8        # 'latency' only (plausibility)
+_AVAILABILITY = 16  # 'availability' / 'reliability'
+
+
+def _name_flags(name: str) -> int:
+    """Classify a characteristic name into the flag bits above."""
+    lname = name.lower()
+    flags = 0
+    if 'throughput' in lname or 'bandwidth' in lname:
+        flags |= _THROUGHPUT
+    if 'latency' in lname or 'delay' in lname:
+        flags |= _DELAY
+    if 'number' in lname or 'count' in lname or 'density' in lname:
+        flags |= _COUNT
+    if 'latency' in lname:
+        flags |= _LATENCY
+    if 'availability' in lname or 'reliability' in lname:
+        flags |= _AVAILABILITY
+    return flags
+
+
+# Structure checked by validate_format, used for the compiled fast path
+FORMAT_SCHEMA = {
+    "type": "object",
+    "required": ["name", "description"],
+    "properties": {
+        "serviceSpecCharacteristic": {
+            "type": "array",
+            "items": {"type": "object", "required": ["name", "value"]}
+        }
+    }
+}
 
 
 class TMF921Validator:
@@ -74,10 +161,31 @@ class TMF921Validator:
         """Initialize validator with GST specification."""
         self.gst_spec = gst_spec
         self.valid_characteristics = {
-            char['name']: char 
+            sys.intern(char['name']): char 
             for char in gst_spec.get('serviceSpecCharacteristic', [])
         }
         
+        # The GST spec is fixed for the validator's lifetime, so resolve each
+        # characteristic's expected type and normalized unit once up front:
+        # name -> (valueType, unitOfMeasure, normalized unitOfMeasure)
+        self._char_plans = {}
+        for name, gst_char in self.valid_characteristics.items():
+            expected_unit = gst_char.get('unitOfMeasure')
+            self._char_plans[name] = (
+                gst_char.get('valueType'),
+                expected_unit,
+                _normalize_unit(expected_unit) if expected_unit else None
+            )
+        
+        # Name classification flags per GST characteristic; names outside the
+        # spec (e.g. hallucinated ones) are classified on demand
+        self._char_flags = {name: _name_flags(name) for name in self.valid_characteristics}
+        
+        # Compiled once per validator; None means always use the manual checks
+        self._format_validate = (
+            fastjsonschema.compile(FORMAT_SCHEMA) if fastjsonschema is not None else None
+        )
+        
     def validate_format(self, intent_dict: Dict[str, Any]) -> tuple[bool, List[str]]:
         """
         Validate TMF921 format correctness.
@@ -85,6 +193,16 @@ class TMF921Validator:
         Returns:
             (is_valid, list_of_errors)
         """
+        # Most intents are well-formed: let the compiled schema accept them
+        # and only walk the manual checks (which build the error messages)
+        # when it rejects one
+        if self._format_validate is not None:
+            try:
+                self._format_validate(intent_dict)
+                return True, []
+            except fastjsonschema.JsonSchemaException:
+                pass
+        
         errors = []
         
         # Check required fields
@@ -127,7 +245,7 @@ class TMF921Validator:
                 errors.append(f"Characteristic '{char_name}' not found in GST specification")
                 continue
             
-            gst_char = self.valid_characteristics[char_name]
+            expected_type, expected_unit, normalized_expected = self._char_plans[char_name]
             
             # Get value from intent
             value_obj = char.get('value', {})
@@ -139,30 +257,16 @@ class TMF921Validator:
                 unit = ''
             
             # ENHANCED: Validate value type matches GST specification
-            expected_type = gst_char.get('valueType')
             if expected_type:
                 type_errors = self._validate_value_type(char_name, value, expected_type)
                 errors.extend(type_errors)
             
-            # ENHANCED: Validate unit of measure
-            expected_unit = gst_char.get('unitOfMeasure')
+            # ENHANCED: Validate unit of measure (allowing common variations)
             if expected_unit and unit:
-                if unit.lower() != expected_unit.lower():
-                    # Allow some common variations
-                    unit_variations = {
-                        'percent': '%',
-                        'percentage': '%',
-                        'milliseconds': 'ms',
-                        'msec': 'ms',
-                        'millisecond': 'ms'
-                    }
-                    normalized_unit = unit_variations.get(unit.lower(), unit.lower())
-                    normalized_expected = unit_variations.get(expected_unit.lower(), expected_unit.lower())
-                    
-                    if normalized_unit != normalized_expected:
-                        errors.append(
-                            f"{char_name}: Unit '{unit}' doesn't match GST specification '{expected_unit}'"
-                        )
+                if _normalize_unit(unit) != normalized_expected:
+                    errors.append(
+                        f"{char_name}: Unit '{unit}' doesn't match GST specification '{expected_unit}'"
+                    )
             
             # ENHANCED: Validate value constraints (if any)
             # Note: GST doesn't have explicit min/max, but we can add logical checks
@@ -233,7 +337,7 @@ class TMF921Validator:
         char_name: str, 
         value: Any, 
         unit: str,
-        value_type: str
+        value_type: Optional[str]
     ) -> List[str]:
         """
         Validate logical constraints on values.
@@ -259,31 +363,33 @@ class TMF921Validator:
             return errors  # Type validation will catch this
         
         # Logical constraints
+        flags = self._flags(char_name)
+        unit_lower = unit.lower()
         
         # 1. Percentages must be 0-100
-        if unit.lower() in ['%', 'percent', 'percentage']:
+        if unit_lower in _PERCENT_UNITS:
             if numeric_value < 0 or numeric_value > 100:
                 errors.append(f"{char_name}: Percentage value {numeric_value} out of range [0, 100]")
         
         # 2. Throughput/bandwidth must be positive
-        if ('throughput' in char_name.lower() or 'bandwidth' in char_name.lower()):
+        if flags & _THROUGHPUT:
             if numeric_value < 0:
                 errors.append(f"{char_name}: Throughput/bandwidth cannot be negative ({numeric_value})")
             
             # Reasonable upper bounds
-            if unit.lower() == 'gbps' and numeric_value > 10000:
+            if unit_lower == 'gbps' and numeric_value > 10000:
                 errors.append(f"{char_name}: Unrealistic bandwidth {numeric_value} Gbps (> 10 Tbps)")
         
         # 3. Latency/delay must be positive and reasonable
-        if ('latency' in char_name.lower() or 'delay' in char_name.lower()):
+        if flags & _DELAY:
             if numeric_value < 0:
                 errors.append(f"{char_name}: Latency/delay cannot be negative ({numeric_value})")
             
-            if unit.lower() == 'ms' and numeric_value < 0.001:
+            if unit_lower == 'ms' and numeric_value < 0.001:
                 errors.append(f"{char_name}: Unrealistic latency {numeric_value} ms (< 1 microsecond)")
         
         # 4. Counts must be non-negative integers
-        if ('number' in char_name.lower() or 'count' in char_name.lower() or 'density' in char_name.lower()):
+        if flags & _COUNT:
             if numeric_value < 0:
                 errors.append(f"{char_name}: Count cannot be negative ({numeric_value})")
             
@@ -292,6 +398,11 @@ class TMF921Validator:
         
         return errors
     
+    def _flags(self, char_name: str) -> int:
+        """Return the classification flags for a characteristic name."""
+        flags = self._char_flags.get(char_name)
+        return flags if flags is not None else _name_flags(char_name)
+    
     def validate_plausibility(self, intent_dict: Dict[str, Any]) -> tuple[bool, List[str]]:
         """
         Validate plausibility of values (hallucination detection).
@@ -305,7 +416,7 @@ class TMF921Validator:
         char_values = {char['name']: char.get('value', {}).get('value') for char in chars}
         
         # Bandwidth plausibility (should be reasonable for telecom)
-        bandwidth_chars = [c for c in chars if 'bandwidth' in c.get('name', '').lower() or 'throughput' in c.get('name', '').lower()]
+        bandwidth_chars = [c for c in chars if self._flags(c.get('name', '')) & _THROUGHPUT]
         for char in bandwidth_chars:
             value = char.get('value', {}).get('value')
             unit = char.get('value', {}).get('unitOfMeasure', '')
@@ -322,7 +433,7 @@ class TMF921Validator:
                     pass
         
         # Latency plausibility
-        latency_chars = [c for c in chars if 'latency' in c.get('name', '').lower()]
+        latency_chars = [c for c in chars if self._flags(c.get('name', '')) & _LATENCY]
         for char in latency_chars:
             value = char.get('value', {}).get('value')
             
@@ -338,7 +449,7 @@ class TMF921Validator:
                     pass
         
         # Availability/reliability plausibility (should be 0-100%)
-        availability_chars = [c for c in chars if 'availability' in c.get('name', '').lower() or 'reliability' in c.get('name', '').lower()]
+        availability_chars = [c for c in chars if self._flags(c.get('name', '')) & _AVAILABILITY]
         for char in availability_chars:
             value = char.get('value', {}).get('value')
             
@@ -239,7 +239,7 @@ if __name__ == "__main__":
     
     # Load results from a previous experiment
     try:
-        with open("results/rag_cloud_50_scenarios/all_results.json") as f:
+        with open("results/rag_cloud_50_scenarios/all_results.json", encoding="utf-8") as f:
             results = json.load(f)
         
         analyzer = ErrorAnalyzer()
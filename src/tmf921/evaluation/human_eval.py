@@ -6,9 +6,10 @@ for human evaluation to validate semantic accuracy.
 """
 
 import json
+import random
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional
 from sklearn.metrics import cohen_kappa_score
 
 
@@ -36,34 +37,42 @@ class HumanEvaluationSuite:
     
     def prepare_eval_set(
         self,
-        results: List[Dict],
+        results: Iterable[Dict],
         output_file: str = "human_evaluation_template.csv"
     ) -> pd.DataFrame:
         """
         Prepare evaluation set with stratified sampling.
         
+        Results are consumed in a single pass with reservoir sampling, so
+        a streamed iterator never has to be held in memory in full.
+        
         Args:
-            results: Experiment results
+            results: Experiment results (list or any iterable of result dicts)
             output_file: CSV file to save template
             
         Returns:
             DataFrame with evaluation template
         """
-        import random
         random.seed(42)
         
-        # Stratified sampling: include successes and failures
-        successes = [r for r in results if r.get('validation', {}).get('overall_valid', False)]
-        failures = [r for r in results if not r.get('validation', {}).get('overall_valid', False)]
+        # Stratified sampling: include successes and failures. Failures get
+        # a reservoir of the full sample size in case successes run short
+        max_success = int(self.sample_size * 0.8)
+        successes, failures = [], []
+        seen_success = seen_failure = 0
+        for r in results:
+            if r.get('validation', {}).get('overall_valid', False):
+                seen_success += 1
+                _reservoir_add(successes, r, seen_success, max_success)
+            else:
+                seen_failure += 1
+                _reservoir_add(failures, r, seen_failure, self.sample_size)
         
         # Sample 80 successes, 20 failures (or proportional if fewer available)
-        n_success = min(int(self.sample_size * 0.8), len(successes))
+        n_success = len(successes)
         n_failure = min(self.sample_size - n_success, len(failures))
         
-        sample = (
-            random.sample(successes, n_success) +
-            random.sample(failures, n_failure)
-        )
+        sample = successes + random.sample(failures, n_failure)
         
         # Create evaluation template
         eval_data = []
@@ -104,7 +113,11 @@ class HumanEvaluationSuite:
         Returns:
             DataFrame with annotations
         """
-        df = pd.read_csv(annotation_file)
+        try:
+            # Multithreaded Arrow CSV reader when pyarrow is installed
+            df = pd.read_csv(annotation_file, engine='pyarrow')
+        except ImportError:
+            df = pd.read_csv(annotation_file)
         
         # Validate required columns
         required = ['id', 'scenario', 'automated_valid', 'human_valid']
@@ -177,18 +190,18 @@ class HumanEvaluationSuite:
         Returns:
             Dictionary with comparison metrics
         """
-        automated = df['automated_valid'].astype(bool).tolist()
-        human = df['human_valid'].astype(bool).tolist()
+        automated = df['automated_valid'].astype(bool).to_numpy()
+        human = df['human_valid'].astype(bool).to_numpy()
         
         # Agreement metrics
-        agreement = sum(1 for i in range(len(human)) if human[i] == automated[i])
+        agreement = int((human == automated).sum())
         agreement_rate = agreement / len(human)
         
-        # Confusion matrix
-        true_positive = sum(1 for i in range(len(human)) if automated[i] and human[i])
-        false_positive = sum(1 for i in range(len(human)) if automated[i] and not human[i])
-        false_negative = sum(1 for i in range(len(human)) if not automated[i] and human[i])
-        true_negative = sum(1 for i in range(len(human)) if not automated[i] and not human[i])
+        # Confusion matrix (plain ints so the result stays JSON-serializable)
+        true_positive = int((automated & human).sum())
+        false_positive = int((automated & ~human).sum())
+        false_negative = int((~automated & human).sum())
+        true_negative = int((~automated & ~human).sum())
         
         # Metrics
         precision = true_positive / (true_positive + false_positive) if (true_positive + false_positive) > 0 else 0
@@ -239,9 +252,17 @@ class HumanEvaluationSuite:
     def save_human_eval_results(
         self,
         df: pd.DataFrame,
-        output_dir: str = "results/human_evaluation"
+        output_dir: str = "results/human_evaluation",
+        comparison: Optional[Dict] = None
     ):
-        """Save human evaluation results and analysis."""
+        """
+        Save human evaluation results and analysis.
+        
+        Args:
+            df: DataFrame with both automated_valid and human_valid columns
+            output_dir: Directory to write results to
+            comparison: Result of compare_automated_vs_human, recomputed if omitted
+        """
         
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -250,7 +271,8 @@ class HumanEvaluationSuite:
         df.to_csv(output_path / "human_annotations.csv", index=False)
         
         # Comparison analysis
-        comparison = self.compare_automated_vs_human(df)
+        if comparison is None:
+            comparison = self.compare_automated_vs_human(df)
         
         with open(output_path / "automated_vs_human.json", 'w') as f:
             json.dump(comparison, f, indent=2)
@@ -258,13 +280,23 @@ class HumanEvaluationSuite:
         print(f"\n[OK] Human evaluation results saved to: {output_path}/")
 
 
+def _reservoir_add(reservoir: List[Dict], item: Dict, seen: int, k: int) -> None:
+    """Algorithm R step: keep a uniform sample of k items from a stream."""
+    if len(reservoir) < k:
+        reservoir.append(item)
+    else:
+        j = random.randrange(seen)
+        if j < k:
+            reservoir[j] = item
+
+
 # Example usage
 if __name__ == "__main__":
     # Step 1: Prepare evaluation set
     import json
     
     # Load experiment results
-    with open("results/rag_cloud_50_scenarios/all_results.json") as f:
+    with open("results/rag_cloud_50_scenarios/all_results.json", encoding="utf-8") as f:
         results = json.load(f)
     
     suite = HumanEvaluationSuite(sample_size=100)
@@ -4,9 +4,20 @@ Characteristic name fuzzy matching and correction.
 Maps common LLM-generated names to correct GST characteristic names.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, FrozenSet, Optional, List, Tuple
 from difflib import get_close_matches
 import re
+import sys
+
+# rapidfuzz (C++ backed) is much faster than difflib; fall back if missing
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+# Below this many names a cdist call takes only microseconds, less than
+# spinning up rapidfuzz's worker threads
+_PARALLEL_MIN_NAMES = 32
 
 
 class CharacteristicNameMapper:
@@ -15,10 +26,15 @@ class CharacteristicNameMapper:
     def __init__(self, gst_spec: Dict):
         """Initialize with GST specification."""
         self.gst_spec = gst_spec
+        # Interned so the same name shared across valid_names, the mapping
+        # tables and the cache is a single object and compares by identity
         self.valid_names = [
-            char['name'] 
+            sys.intern(char['name'])
             for char in gst_spec.get('serviceSpecCharacteristic', [])
         ]
+        self._valid_set: FrozenSet[str] = frozenset(self.valid_names)
+        # Lowercased names for the partial-match fallback, computed once
+        self._valid_lower = [(n, n.lower()) for n in self.valid_names]
         
         # Common name mappings learned from errors
         self.KNOWN_MAPPINGS = {
@@ -44,6 +60,21 @@ class CharacteristicNameMapper:
             "User count": "Number of UEs per network slice",
             "Concurrent users": "Number of UEs per network slice",
         }
+        
+        # Case/whitespace-insensitive lookup table: known mappings first, then
+        # the canonical GST names themselves, so common variants resolve with
+        # a dict hit instead of falling through to fuzzy matching
+        self._known_norm = {
+            sys.intern(k.lower().strip()): sys.intern(v)
+            for k, v in self.KNOWN_MAPPINGS.items()
+        }
+        for n in self.valid_names:
+            self._known_norm.setdefault(sys.intern(n.lower().strip()), n)
+        
+        # Memoized corrections keyed by (name, threshold). LLM outputs repeat
+        # the same names constantly, and neither valid_names nor
+        # KNOWN_MAPPINGS change after construction.
+        self._cache: Dict[Tuple[str, float], Optional[str]] = {}
     
     def correct_name(self, name: str, threshold: float = 0.6) -> Optional[str]:
         """
@@ -56,29 +87,87 @@ class CharacteristicNameMapper:
         Returns:
             Corrected name if found, None otherwise
         """
-        # Exact match (already correct)
-        if name in self.valid_names:
-            return name
+        key = (name, threshold)
+        if key not in self._cache:
+            self._cache[key] = self._match_name(name, threshold)
+        return self._cache[key]
+    
+    def _match_name(self, name: str, threshold: float) -> Optional[str]:
+        """Resolve a name without the cache (exact, known, fuzzy, partial)."""
+        name_lower = name.lower()
+        corrected = self._lookup_name(name, name_lower)
+        if corrected:
+            return corrected
         
-        # Check known mappings
-        if name in self.KNOWN_MAPPINGS:
-            return self.KNOWN_MAPPINGS[name]
+        # Fuzzy matching (normalized similarity ratio, as with difflib)
+        if process is not None:
+            match = process.extractOne(
+                name, self.valid_names, scorer=fuzz.ratio, score_cutoff=threshold * 100
+            )
+            if match:
+                return match[0]
+        else:
+            matches = get_close_matches(name, self.valid_names, n=1, cutoff=threshold)
+            if matches:
+                return matches[0]
         
-        # Fuzzy matching using difflib
-        matches = get_close_matches(name, self.valid_names, n=1, cutoff=threshold)
-        if matches:
-            return matches[0]
+        return self._partial_match(name_lower)
+    
+    def _lookup_name(self, name: str, name_lower: str) -> Optional[str]:
+        """Exact GST name or known mapping (ignoring case and padding)."""
+        # Exact match (already correct)
+        if name in self._valid_set:
+            return name
         
-        # Partial string matching (contains)
-        name_lower = name.lower()
-        for valid_name in self.valid_names:
-            if name_lower in valid_name.lower() or valid_name.lower() in name_lower:
-                # Check if it's a meaningful match (not just "a" matching)
-                if len(name_lower) > 3:
+        # Check known mappings and GST names, ignoring case and padding
+        return self._known_norm.get(name_lower.strip())
+    
+    def _partial_match(self, name_lower: str) -> Optional[str]:
+        """Partial string matching (contains) against the GST names."""
+        # Only meaningful for longer names (not just "a" matching)
+        if len(name_lower) > 3:
+            for valid_name, valid_lower in self._valid_lower:
+                if name_lower in valid_lower or valid_lower in name_lower:
                     return valid_name
         
         return None
     
+    def _correct_names_batch(self, names: List[str], threshold: float = 0.6) -> None:
+        """
+        Populate the correction cache for several names at once.
+        
+        Names not resolved by exact/known lookup are fuzzy-matched in a single
+        rapidfuzz cdist call (one native K x N similarity matrix) instead of
+        K separate scans over the valid names.
+        """
+        pending = []
+        for name in dict.fromkeys(names):
+            key = (name, threshold)
+            if key in self._cache:
+                continue
+            name_lower = name.lower()
+            corrected = self._lookup_name(name, name_lower)
+            if corrected:
+                self._cache[key] = corrected
+            else:
+                pending.append((name, name_lower))
+        
+        if not pending:
+            return
+        
+        # rapidfuzz releases the GIL and splits rows across native threads
+        workers = -1 if len(pending) >= _PARALLEL_MIN_NAMES else 1
+        scores = process.cdist(
+            [name for name, _ in pending], self.valid_names,
+            scorer=fuzz.ratio, workers=workers
+        )
+        best = scores.argmax(axis=1)
+        for (name, name_lower), row, col in zip(pending, scores, best):
+            if row[col] >= threshold * 100:
+                self._cache[(name, threshold)] = self.valid_names[col]
+            else:
+                self._cache[(name, threshold)] = self._partial_match(name_lower)
+    
     def correct_intent(self, intent_dict: Dict) -> tuple[Dict, List[str]]:
         """
         Correct all characteristic names in an intent.
@@ -94,11 +183,18 @@ class CharacteristicNameMapper:
         if 'serviceSpecCharacteristic' not in intent_dict:
             return intent_dict, corrections
         
-        for char in intent_dict['serviceSpecCharacteristic']:
-            original_name = char.get('name')
-            if not original_name:
-                continue
-            
+        # Read each name once; characteristics without a name are skipped
+        pairs = [
+            (char, name)
+            for char in intent_dict['serviceSpecCharacteristic']
+            if (name := char.get('name'))
+        ]
+        
+        # Fuzzy-match every uncached name in one vectorized call
+        if process is not None:
+            self._correct_names_batch([name for _, name in pairs if isinstance(name, str)])
+        
+        for char, original_name in pairs:
             corrected_name = self.correct_name(original_name)
             
             if corrected_name and corrected_name != original_name:
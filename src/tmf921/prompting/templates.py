@@ -5,68 +5,25 @@ Based on SOTA 5-section prompting (Bimo et al., 2025) and TMF921 specification.
 """
 
 import json
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class TMF921PromptBuilder:
-    """Build structured prompts following SOTA best practices."""
-    
-    def __init__(self, gst_spec: Dict[str, Any]):
-        """
-        Initialize with GST specification.
-        
-        Args:
-            gst_spec: Loaded GST specification JSON
-        """
-        self.gst_spec = gst_spec
-        self.characteristic_names = [
-            char['name'] 
-            for char in gst_spec.get('serviceSpecCharacteristic', [])
-        ]
-        
-        # Key characteristics for examples
-        self.key_chars = self._extract_key_characteristics()
-    
-    def _extract_key_characteristics(self) -> List[str]:
-        """Extract most relevant characteristics for prompting."""
-        priority_keywords = [
-            'bandwidth', 'throughput', 'latency', 'delay',
-            'availability', 'reliability', 'coverage', 'area'
-        ]
-        
-        key_chars = []
-        for char in self.gst_spec.get('serviceSpecCharacteristic', []):
-            name = char.get('name', '').lower()
-            if any(kw in name for kw in priority_keywords):
-                key_chars.append(char.get('name'))
-        
-        return key_chars[:20]  # Top 20 most relevant
-    
-    def build_zero_shot_prompt(
-        self,
-        scenario: str,
-        include_schema: bool = True,
-        include_examples_list: bool = False
-    ) -> str:
-        """
-        Build zero-shot structured 5-section prompt.
-        
-        Following Bimo et al., 2025 architecture:
-        - Section 1: Intent specification
-        - Section 2: Network topology context
-        - Section 3: KPIs and constraints
-        - Section 4: Configuration parameter space
-        - Section 5: Output format specification
-        
-        Args:
-            scenario: Natural language scenario to translate
-            include_schema: Whether to include full characteristic list
-            include_examples_list: Whether to list example characteristic names
-            
-        Returns:
-            Formatted prompt string
-        """
-        prompt = f"""# SECTION 1: Intent Specification
+
+# Substrings that mark a characteristic as worth listing in zero-shot prompts,
+# matched case-insensitively as one compiled alternation
+_PRIORITY_RE = re.compile(
+    r'bandwidth|throughput|latency|delay|availability|reliability|coverage|area',
+    re.IGNORECASE
+)
+
+
+# Fixed parts of the zero-shot prompt, built once at import time
+_ZERO_SHOT_HEADER = """# SECTION 1: Intent Specification
 
 You are tasked with translating a natural language network requirement into a TMF921-compliant Intent JSON structure.
 
@@ -95,41 +52,37 @@ Extract the following types of requirements from the scenario:
 
 The output MUST use characteristics from the GST specification. """
 
-        if include_schema:
-            prompt += f"Available characteristics include:\n\n"
-            for char_name in self.key_chars:
-                prompt += f"- {char_name}\n"
-        
-        if include_examples_list:
-            prompt += f"\n**Key Characteristics to Consider:**\n"
-            prompt += "- Availability\n"
-            prompt += "- Downlink throughput per network slice: Maximum downlink throughput\n"
-            prompt += "- Uplink throughput per network slice: Maximum uplink throughput\n"
-            prompt += "- E2E latency\n"
-            prompt += "- Jitter\n"
-            prompt += "- Reliability\n"
-            prompt += "- User data rate\n"
-            prompt += "- Area of Service\n"
-        
-        prompt += f"""
+_ZERO_SHOT_EXAMPLES_LIST = (
+    "\n**Key Characteristics to Consider:**\n"
+    "- Availability\n"
+    "- Downlink throughput per network slice: Maximum downlink throughput\n"
+    "- Uplink throughput per network slice: Maximum uplink throughput\n"
+    "- E2E latency\n"
+    "- Jitter\n"
+    "- Reliability\n"
+    "- User data rate\n"
+    "- Area of Service\n"
+)
+
+_ZERO_SHOT_FOOTER = """
 
 # SECTION 5: Output Format Specification
 
 Generate a valid JSON object with the following structure:
 
-{{
+{
   "name": "<descriptive intent name>",
   "description": "<human-readable description of what this intent achieves>",
   "serviceSpecCharacteristic": [
-    {{
+    {
       "name": "<characteristic name from GST>",
-      "value": {{
+      "value": {
         "value": "<extracted value>",
         "unitOfMeasure": "<unit if applicable, e.g., 'kbps', 'ms', 'percent'>"
-      }}
-    }}
+      }
+    }
   ]
-}}
+}
 
 **Critical Instructions:**
 1. Use ONLY characteristic names that exist in the TMF GST specification
@@ -140,7 +93,89 @@ Generate a valid JSON object with the following structure:
 
 **Output (JSON only):**
 """
-        return prompt
+
+SYSTEM_PROMPT = """You are a telecommunications network configuration expert specializing in TMF921 Intent Management API standards. Your role is to translate natural language network requirements into precise, standards-compliant TMF921 Intent JSON structures.
+
+You have deep knowledge of:
+- TMF921 Intent Management API specification
+- TMF GST (Generic Slice Template) for network slices
+- 5G/6G network architecture and KPIs
+- Telecommunications terminology and best practices
+
+Your translations must be:
+- Accurate: Correctly extract all requirements from natural language
+- Compliant: Use only valid TMF921 characteristic names  
+- Realistic: Values must be plausible for real telecom networks
+- Complete: Cover all mentioned requirements
+- Precise: Include appropriate units of measure
+
+You MUST output valid JSON only, with no additional commentary."""
+
+
+class TMF921PromptBuilder:
+    """Build structured prompts following SOTA best practices."""
+    
+    def __init__(self, gst_spec: Dict[str, Any]):
+        """
+        Initialize with GST specification.
+        
+        Args:
+            gst_spec: Loaded GST specification JSON
+        """
+        self.gst_spec = gst_spec
+        
+        # All names and the key characteristics for examples, in one pass
+        self.characteristic_names, self.key_chars = self._extract_key_characteristics()
+        
+        # Characteristic list for the zero-shot prompt, fixed per spec
+        self._schema_block = "Available characteristics include:\n\n" + "".join(
+            f"- {char_name}\n" for char_name in self.key_chars
+        )
+    
+    def _extract_key_characteristics(self) -> Tuple[List[str], List[str]]:
+        """
+        Extract all characteristic names and the most relevant ones for prompting.
+        
+        Returns:
+            Tuple of (all characteristic names, up to 20 priority names)
+        """
+        names = []
+        key_chars = []
+        for char in self.gst_spec.get('serviceSpecCharacteristic', []):
+            name = char['name']
+            names.append(name)
+            if _PRIORITY_RE.search(name):
+                key_chars.append(name)
+        
+        return names, key_chars[:20]  # Top 20 most relevant
+    
+    def build_zero_shot_prompt(
+        self,
+        scenario: str,
+        include_schema: bool = True,
+        include_examples_list: bool = False
+    ) -> str:
+        """
+        Build zero-shot structured 5-section prompt.
+        
+        Following Bimo et al., 2025 architecture:
+        - Section 1: Intent specification
+        - Section 2: Network topology context
+        - Section 3: KPIs and constraints
+        - Section 4: Configuration parameter space
+        - Section 5: Output format specification
+        
+        Args:
+            scenario: Natural language scenario to translate
+            include_schema: Whether to include full characteristic list
+            include_examples_list: Whether to list example characteristic names
+            
+        Returns:
+            Formatted prompt string
+        """
+        examples_list = _ZERO_SHOT_EXAMPLES_LIST if include_examples_list else ""
+        schema_block = self._schema_block if include_schema else ""
+        return f"{_ZERO_SHOT_HEADER.format(scenario=scenario)}{schema_block}{examples_list}{_ZERO_SHOT_FOOTER}"
     
     def build_few_shot_prompt(
         self,
@@ -159,36 +194,36 @@ Generate a valid JSON object with the following structure:
         Returns:
             Formatted few-shot prompt
         """
-        base_prompt = """You are an expert in translating natural language network requirements into TMF921-compliant Intent JSON structures.
+        parts = ["""You are an expert in translating natural language network requirements into TMF921-compliant Intent JSON structures.
 
 # Task
 
 Translate the given scenario into a valid TMF921 Intent JSON following the examples below.
 
-"""
+"""]
         
         # Add examples
         for i, example in enumerate(examples[:max_examples], 1):
-            base_prompt += f"""## Example {i}
+            parts.append(f"""## Example {i}
 
 **Scenario:** {example['scenario']}
 
 **TMF921 Intent:**
 ```json
-{json.dumps(example['intent'], indent=2)}
+{_example_json(example['intent'])}
 ```
 
-"""
+""")
         
         # Add actual task
-        base_prompt += f"""# Your Task
+        parts.append(f"""# Your Task
 
 **Scenario:** {scenario}
 
 **TMF921 Intent (JSON only):**
-"""
+""")
         
-        return base_prompt
+        return "".join(parts)
     
     def build_cot_prompt(self, scenario: str) -> str:
         """
@@ -247,7 +282,7 @@ Check that:
         Returns:
             Formatted RAG prompt
         """
-        prompt = f"""# Task: TMF921 Intent Translation
+        parts = [f"""# Task: TMF921 Intent Translation
 
 Translate the following network requirement into a TMF921-compliant Intent JSON structure.
 
@@ -258,82 +293,67 @@ Translate the following network requirement into a TMF921-compliant Intent JSON
 
 Based on this scenario, the following characteristics are most relevant:
 
-"""
+"""]
         
         # Add retrieved characteristics
         for i, char in enumerate(retrieved_characteristics, 1):
-            prompt += f"{i}. **{char['name']}**\n"
-            prompt += f"   - Type: {char['valueType']}\n"
+            parts.append(f"{i}. **{char['name']}**\n")
+            parts.append(f"   - Type: {char['valueType']}\n")
             if char.get('description'):
-                prompt += f"   - Description: {char['description']}\n"
-            prompt += "\n"
+                parts.append(f"   - Description: {char['description']}\n")
+            parts.append("\n")
         
         # Add instruction
-        prompt += """## Instructions
+        parts.append("""## Instructions
 
 1. Extract network requirements from the scenario (bandwidth, latency, availability, etc.)
 2. Map each requirement to the MOST APPROPRIATE characteristic from the list above
 3. Use the EXACT characteristic names as provided
 4. Provide realistic values with appropriate units
 
-"""
+""")
         
         # Optionally add few-shot examples
         if include_examples and EXAMPLE_SCENARIOS:
-            prompt += f"""## Example Translation
+            parts.append(f"""## Example Translation
 
 **Scenario:** {EXAMPLE_SCENARIOS[0]['scenario']}
 
 **TMF921 Intent:**
 ```json
-{json.dumps(EXAMPLE_SCENARIOS[0]['intent'], indent=2)}
+{_EXAMPLE_JSON[0]}
 ```
 
-"""
+""")
         
         # Add output format
-        prompt += f"""## Output Format
+        parts.append("""## Output Format
 
 Generate valid JSON with this structure:
 
-{{
+{
   "name": "<descriptive intent name>",
   "description": "<what this intent achieves>",
   "serviceSpecCharacteristic": [
-    {{
+    {
       "name": "<EXACT name from list above>",
-      "value": {{
+      "value": {
         "value": "<extracted value>",
         "unitOfMeasure": "<unit, e.g., 'kbps', 'ms', 'percent'>"
-      }}
-    }}
+      }
+    }
   ]
-}}
+}
 
 **CRITICAL:** Use ONLY characteristic names from the retrieved list above.
 
 **Output (JSON only):**
-"""
-        return prompt
+""")
+        return "".join(parts)
     
     def build_system_prompt(self) -> str:
         """Build system prompt for LLM."""
-        return """You are a telecommunications network configuration expert specializing in TMF921 Intent Management API standards. Your role is to translate natural language network requirements into precise, standards-compliant TMF921 Intent JSON structures.
-
-You have deep knowledge of:
-- TMF921 Intent Management API specification
-- TMF GST (Generic Slice Template) for network slices
-- 5G/6G network architecture and KPIs
-- Telecommunications terminology and best practices
-
-Your translations must be:
-- Accurate: Correctly extract all requirements from natural language
-- Compliant: Use only valid TMF921 characteristic names  
-- Realistic: Values must be plausible for real telecom networks
-- Complete: Cover all mentioned requirements
-- Precise: Include appropriate units of measure
-
-You MUST output valid JSON only, with no additional commentary."""
+        return SYSTEM_PROMPT
 
 
 # Pre-defined high-quality examples for few-shot learning
@@ -412,13 +432,36 @@ EXAMPLE_SCENARIOS = [
 ]
 
 
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# EXAMPLE_SCENARIOS never change, so serialize their intents once
+_EXAMPLE_JSON = [_dumps_indented(ex['intent']) for ex in EXAMPLE_SCENARIOS]
+_EXAMPLE_JSON_BY_ID = {
+    id(ex['intent']): (ex['intent'], text)
+    for ex, text in zip(EXAMPLE_SCENARIOS, _EXAMPLE_JSON)
+}
+
+
+def _example_json(intent: Dict[str, Any]) -> str:
+    """Serialize an example intent, reusing the cached text for built-in examples."""
+    cached = _EXAMPLE_JSON_BY_ID.get(id(intent))
+    if cached is not None and cached[0] is intent:
+        return cached[1]
+    return _dumps_indented(intent)
+
+
 if __name__ == "__main__":
-    # Test prompt generation
-    import json
-    
     # Load GST
-    with open('gst.json', 'r', encoding='utf-8') as f:
-        gst_spec = json.load(f)
+    with open('gst.json', 'rb') as f:
+        gst_spec = orjson.loads(f.read()) if orjson is not None else json.load(f)
     
     builder = TMF921PromptBuilder(gst_spec)
     
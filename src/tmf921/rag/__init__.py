@@ -1,9 +1,11 @@
 """RAG module: indexing and retrieval."""
 
 from .indexer import GSTIndexer
-from .retriever import GSTRetriever
+from .retriever import Characteristic, GSTRetriever, PreparedQuery
 
 __all__ = [
     "GSTIndexer",
+    "Characteristic",
     "GSTRetriever",
+    "PreparedQuery",
 ]
@@ -4,15 +4,38 @@ RAG Indexer - Create vector database for TMF921 GST characteristics.
 Indexes all 87 service characteristics with semantic embeddings for retrieval.
 """
 
+import hashlib
 import json
+from collections import Counter
 from pathlib import Path
-import chromadb
-from chromadb.config import Settings
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Same model ChromaDB's default embedding function uses, so query_texts
+# embedded by the collection stay in the same space as the indexed vectors
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
 
 class GSTIndexer:
     """Index GST characteristics into vector database."""
     
+    _embedder = None
+    
+    @classmethod
+    def get_embedder(cls):
+        """Load the sentence embedding model once, on GPU when available."""
+        if cls._embedder is None:
+            import torch
+            from sentence_transformers import SentenceTransformer
+            
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            cls._embedder = SentenceTransformer(EMBEDDING_MODEL, device=device)
+        return cls._embedder
+    
     def __init__(self, gst_path: str = "gst.json", db_path: str = "chroma_db"):
         """
         Initialize indexer.
@@ -25,21 +48,79 @@ class GSTIndexer:
         self.db_path = Path(db_path)
         
         # Load GST specification
-        with open(gst_path, 'r', encoding='utf-8') as f:
-            self.gst_spec = json.load(f)
+        with open(gst_path, 'rb') as f:
+            self.gst_spec = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        
+        # Documents, metadata and ids for every characteristic, built in one pass
+        self._documents, self._metadatas, self._ids = self._prepare()
         
-        # Initialize ChromaDB
+        # Initialize ChromaDB (imported here so that importing this module
+        # does not pull in chromadb's heavy dependency chain)
+        import chromadb
         self.client = chromadb.PersistentClient(path=str(self.db_path))
+    
+    def _prepare(self) -> Tuple[List[str], List[Dict[str, Any]], List[str]]:
+        """Build documents, metadata and ids for all characteristics."""
+        characteristics = self.gst_spec.get('serviceSpecCharacteristic', [])
         
-    def create_index(self, collection_name: str = "gst_characteristics"):
+        documents = []
+        metadatas = []
+        ids = []
+        
+        for i, char in enumerate(characteristics):
+            # Create rich document for embedding
+            name = char.get('name', '')
+            description = char.get('description', '')
+            value_type = char.get('valueType', 'Unknown')
+            
+            # Combine name and description for better semantic search
+            documents.append(f"{name}. {description}")
+            
+            # Store full metadata
+            metadatas.append({
+                'name': name,
+                'description': description,
+                'valueType': value_type,
+                'index': i
+            })
+            ids.append(f"char_{i}")
+        
+        return documents, metadatas, ids
+        
+    def spec_hash(self) -> str:
+        """Fingerprint of the GST spec and embedding model behind an index."""
+        return self.hash_spec(self.gst_spec)
+    
+    @staticmethod
+    def hash_spec(gst_spec: Dict[str, Any]) -> str:
+        """Fingerprint a parsed GST spec without opening ChromaDB."""
+        payload = json.dumps(gst_spec, sort_keys=True) + EMBEDDING_MODEL
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def create_index(self, collection_name: str = "gst_characteristics", force: bool = False):
         """
         Create vector index for GST characteristics.
         
+        An existing collection built from the same GST spec is reused as-is
+        unless force is set.
+        
         Args:
             collection_name: Name for the ChromaDB collection
+            force: Rebuild even if the stored index is up to date
         """
         print(f"\n[1/3] Creating ChromaDB collection: {collection_name}")
         
+        spec_hash = self.spec_hash()
+        if not force:
+            try:
+                existing = self.client.get_collection(collection_name)
+            except Exception:
+                existing = None
+            if existing is not None and (existing.metadata or {}).get('spec_hash') == spec_hash:
+                print("  [OK] Index is up to date, skipping re-indexing")
+                print(f"\n[SUCCESS] Index available at: {self.db_path}/")
+                return existing
+        
         # Delete existing collection if it exists
         try:
             self.client.delete_collection(collection_name)
@@ -50,44 +131,32 @@ class GSTIndexer:
         # Create new collection
         collection = self.client.create_collection(
             name=collection_name,
-            metadata={"description": "TMF921 GST service characteristics"}
+            metadata={
+                "description": "TMF921 GST service characteristics",
+                "hnsw:space": "cosine",
+                "spec_hash": spec_hash,
+            }
         )
         
         print(f"\n[2/3] Indexing characteristics...")
         
-        # Prepare data for indexing
-        characteristics = self.gst_spec.get('serviceSpecCharacteristic', [])
+        documents, metadatas, ids = self._documents, self._metadatas, self._ids
         
-        documents = []
-        metadatas = []
-        ids = []
+        # Embed all documents in one batched forward pass instead of letting
+        # ChromaDB embed them implicitly on CPU
+        embeddings = self.get_embedder().encode(
+            documents,
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype('float32')
         
-        for i, char in enumerate(characteristics):
-            # Create rich document for embedding
-            name = char.get('name', '')
-            description = char.get('description', '')
-            value_type = char.get('valueType', 'Unknown')
-            
-            # Combine name and description for better semantic search
-            document = f"{name}. {description}"
-            
-            # Store full metadata
-            metadata = {
-                'name': name,
-                'description': description,
-                'valueType': value_type,
-                'index': i
-            }
-            
-            documents.append(document)
-            metadatas.append(metadata)
-            ids.append(f"char_{i}")
-        
-        # Add to collection (ChromaDB auto-generates embeddings)
         collection.add(
             documents=documents,
             metadatas=metadatas,
-            ids=ids
+            ids=ids,
+            embeddings=embeddings.tolist()
         )
         
         print(f"  [OK] Indexed {len(documents)} characteristics")
@@ -111,15 +180,12 @@ class GSTIndexer:
         """Get indexing statistics."""
         chars = self.gst_spec.get('serviceSpecCharacteristic', [])
         
-        value_types = {}
-        for char in chars:
-            vtype = char.get('valueType', 'Unknown')
-            value_types[vtype] = value_types.get(vtype, 0) + 1
+        value_types = Counter(c.get('valueType', 'Unknown') for c in chars)
         
         return {
             'total_characteristics': len(chars),
-            'value_types': value_types,
-            'has_descriptions': sum(1 for c in chars if c.get('description')),
+            'value_types': dict(value_types),
+            'has_descriptions': sum(bool(c.get('description')) for c in chars),
         }
 
 
@@ -153,17 +219,18 @@ if __name__ == "__main__":
         "coverage area for rural deployment"
     ]
     
-    for query in test_queries:
-        results = collection.query(
-            query_texts=[query],
-            n_results=3
-        )
-        
+    # One batched query embeds all test queries in a single call
+    results = collection.query(
+        query_texts=test_queries,
+        n_results=3
+    )
+    
+    for q, query in enumerate(test_queries):
         print(f"Query: {query}")
         print(f"  Top results:")
         for i, (name, distance) in enumerate(zip(
-            results['metadatas'][0],
-            results['distances'][0]
+            results['metadatas'][q],
+            results['distances'][q]
         ), 1):
             similarity = 1 - distance  # Convert distance to similarity
             print(f"    {i}. {name['name']} (similarity: {similarity:.3f})")
@@ -2,81 +2,459 @@
 RAG Retriever - Semantic search for relevant GST characteristics.
 """
 
-import chromadb
-from typing import List, Dict, Any
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Hashable, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .indexer import GSTIndexer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Prepended to scenarios to steer retrieval towards slice requirements
+_PREFIX = "network slice requirements: "
+
+# Files written by scripts/build_gst_index.py
+EMBEDDINGS_FILE = "embeddings.npy"
+METAS_FILE = "metas.json"
+SPEC_HASH_FILE = "spec_hash.txt"
+
+
+class Characteristic(NamedTuple):
+    """A retrieved GST characteristic and its similarity to the query."""
+    
+    name: str
+    description: str
+    valueType: str
+    similarity: float
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict form, as returned by earlier versions of the retriever."""
+        return self._asdict()
+    
+    def __getitem__(self, key):
+        # Field-name lookups keep code written against dict results working
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+
+class PreparedQuery(NamedTuple):
+    """A retrieval query embedded once, reusable across lookups."""
+    
+    text: str
+    embedding: np.ndarray  # L2-normalized, read-only
+
+
+class _QueryCache:
+    """Thread-safe LRU cache with a per-entry time-to-live for retrieval results."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 class GSTRetriever:
     """Retrieve relevant GST characteristics using semantic search."""
     
-    def __init__(self, db_path: str = "chroma_db", collection_name: str = "gst_characteristics"):
+    def __init__(
+        self,
+        db_path: str = "chroma_db",
+        collection_name: str = "gst_characteristics",
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+        in_memory: bool = True,
+        index_dir: Optional[str] = "gst_index",
+        gst_path: str = "gst.json"
+    ):
         """
         Initialize retriever.
         
         Args:
             db_path: Path to ChromaDB database
             collection_name: Name of the collection
+            cache_size: Maximum number of cached queries (0 disables caching)
+            cache_ttl: Seconds a cached result stays valid
+            in_memory: Search an in-process copy of the embeddings instead of
+                querying ChromaDB for every lookup
+            index_dir: Directory with an exported index (see
+                scripts/build_gst_index.py); when present and built from
+                the current GST spec, ChromaDB is not opened at all
+            gst_path: GST specification the exported index is checked against
         """
+        # Experiments retrieve for the same scenario text more than once
+        # (prompt building and result tracking), so repeat queries are
+        # answered from memory instead of re-embedding and searching
+        self._cache = _QueryCache(maxsize=cache_size, ttl=cache_ttl)
+        
+        # Queries are embedded here with one shared model instance rather
+        # than through ChromaDB's embedding function on every call
+        self._embedder = GSTIndexer.get_embedder()
+        
+        # The collection is small and static, so exact search over an
+        # in-memory matrix beats a ChromaDB round trip per query
+        self._matrix = None
+        self._metas = []
+        self.gst_path = gst_path
+        self.client = None
+        self.collection = None
+        if in_memory and index_dir and self._load_exported(Path(index_dir)):
+            return
+        
+        # Imported lazily to keep module import cheap
+        import chromadb
         self.client = chromadb.PersistentClient(path=db_path)
         self.collection = self.client.get_collection(collection_name)
+        if in_memory:
+            self._load_matrix()
+    
+    def _spec_hash(self) -> Optional[str]:
+        """Fingerprint of the GST spec at gst_path, or None if unreadable."""
+        try:
+            data = Path(self.gst_path).read_bytes()
+        except OSError:
+            return None
+        spec = orjson.loads(data) if orjson is not None else json.loads(data)
+        return GSTIndexer.hash_spec(spec)
+    
+    def _load_exported(self, index_dir: Path) -> bool:
+        """
+        Memory-map an exported embedding matrix and its metadata, if present.
+        
+        The export is only used when it was built from the current GST spec;
+        a stale or unversioned export is ignored in favour of ChromaDB.
+        """
+        embeddings_file = index_dir / EMBEDDINGS_FILE
+        metas_file = index_dir / METAS_FILE
+        if not (embeddings_file.is_file() and metas_file.is_file()):
+            return False
+        
+        hash_file = index_dir / SPEC_HASH_FILE
+        exported_hash = hash_file.read_text(encoding='utf-8').strip() if hash_file.is_file() else None
+        if exported_hash is None or exported_hash != self._spec_hash():
+            logger.warning(
+                "Exported index in %s does not match %s, using ChromaDB instead; "
+                "re-run scripts/build_gst_index.py to refresh it",
+                index_dir, self.gst_path
+            )
+            return False
+        
+        # Stored already L2-normalized; mapped read-only, so startup only
+        # touches the pages a query actually reads
+        self._matrix = np.load(embeddings_file, mmap_mode='r')
+        self._metas = [tuple(meta) for meta in json.loads(metas_file.read_bytes())]
+        return True
+    
+    def export_index(self, index_dir: str = "gst_index") -> Path:
+        """
+        Write the in-memory embedding matrix and metadata for fast startup.
+        
+        Args:
+            index_dir: Output directory
+            
+        Returns:
+            Path of the output directory
+        """
+        if self._matrix is None:
+            raise RuntimeError("No in-memory index to export (collection has no embeddings)")
+        
+        out = Path(index_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        np.save(out / EMBEDDINGS_FILE, np.ascontiguousarray(self._matrix, dtype=np.float32))
+        (out / METAS_FILE).write_text(
+            json.dumps([list(meta) for meta in self._metas], ensure_ascii=False),
+            encoding='utf-8'
+        )
+        
+        # Prefer the fingerprint the collection was built with, so exporting
+        # a stale collection does not produce an export that looks current
+        metadata = (self.collection.metadata or {}) if self.collection is not None else {}
+        spec_hash = metadata.get('spec_hash') or self._spec_hash()
+        if spec_hash:
+            (out / SPEC_HASH_FILE).write_text(spec_hash, encoding='utf-8')
+        return out
+    
+    @property
+    def index_shape(self) -> Optional[Tuple[int, int]]:
+        """(characteristics, embedding dims) of the in-memory index, if loaded."""
+        if self._matrix is None:
+            return None
+        return len(self._metas), self._matrix.shape[1]
+    
+    def _load_matrix(self) -> None:
+        """Export embeddings and metadata from ChromaDB for in-process search."""
+        try:
+            data = self.collection.get(include=['embeddings', 'metadatas'])
+        except Exception:
+            return
+        
+        embeddings = data.get('embeddings')
+        if embeddings is None or len(embeddings) == 0:
+            return
+        
+        # L2-normalize so a dot product is the cosine similarity
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._matrix = matrix / norms
+        self._metas = [
+            (metadata['name'], metadata['description'], metadata['valueType'])
+            for metadata in data['metadatas']
+        ]
         
     def retrieve(
         self, 
-        query: str, 
+        query: Union[str, PreparedQuery], 
         n_results: int = 5,
-        min_similarity: float = -1.0  # Allow negative similarities (distance > 1)
-    ) -> List[Dict[str, Any]]:
+        min_similarity: float = -1.0,  # Allow negative similarities (distance > 1)
+        no_cache: bool = False
+    ) -> List[Characteristic]:
         """
         Retrieve top-k relevant characteristics.
         
         Args:
-            query: Search query (typically the scenario text)
+            query: Search query (typically the scenario text) or a prepared query
             n_results: Number of results to return
             min_similarity: Minimum similarity threshold (accepts negative values)
+            no_cache: Bypass the result cache (always search) and do not store the result
             
         Returns:
-            List of characteristic dicts with metadata and similarity scores
+            List of characteristics with metadata and similarity scores
         """
-        # Query ChromaDB
+        return self.retrieve_batch(
+            [query], n_results=n_results, min_similarity=min_similarity, no_cache=no_cache
+        )[0]
+    
+    def retrieve_batch(
+        self,
+        queries: List[Union[str, PreparedQuery]],
+        n_results: int = 5,
+        min_similarity: float = -1.0,
+        no_cache: bool = False
+    ) -> List[List[Characteristic]]:
+        """
+        Retrieve top-k relevant characteristics for several queries at once.
+        
+        Queries not already cached are embedded together (prepared queries
+        reuse their embedding) and searched in a single call.
+        
+        Args:
+            queries: Search queries, as text or prepared queries
+            n_results: Number of results to return per query
+            min_similarity: Minimum similarity threshold (accepts negative values)
+            no_cache: Bypass the result cache (always search) and do not store the results
+            
+        Returns:
+            One list of characteristics per query, in query order
+        """
+        texts = [q.text if isinstance(q, PreparedQuery) else q for q in queries]
+        
+        ranked = {}
+        if not no_cache:
+            for text in texts:
+                cached = self._cache.get((text, n_results))
+                if cached is not None:
+                    ranked[text] = cached
+        
+        pending = {}
+        for query, text in zip(queries, texts):
+            if text not in ranked:
+                pending.setdefault(text, query)
+        
+        if pending:
+            embeddings = self._embed_queries(list(pending.values()))
+            if self._matrix is not None:
+                rows = self._search_matrix(embeddings, n_results)
+            else:
+                rows = self._search_chroma(embeddings, n_results)
+            
+            for text, row in zip(pending, rows):
+                ranked[text] = row
+                if not no_cache:
+                    self._cache.put((text, n_results), row)
+        
+        return [self._format(ranked[text], min_similarity) for text in texts]
+    
+    def prepare(self, scenario: str) -> PreparedQuery:
+        """
+        Embed a scenario query once for repeated retrieval.
+        
+        Args:
+            scenario: Natural language scenario description
+            
+        Returns:
+            PreparedQuery accepted by retrieve and retrieve_batch
+        """
+        text = _PREFIX + scenario
+        embedding = self._embed([text])[0]
+        embedding.flags.writeable = False
+        return PreparedQuery(text, embedding)
+    
+    def _embed_queries(self, queries: List[Union[str, PreparedQuery]]) -> np.ndarray:
+        """Embeddings for mixed text / prepared queries, encoding the text ones together."""
+        raw = [q for q in queries if not isinstance(q, PreparedQuery)]
+        fresh = iter(self._embed(raw)) if raw else iter(())
+        return np.stack([
+            q.embedding if isinstance(q, PreparedQuery) else next(fresh)
+            for q in queries
+        ])
+    
+    def _embed(self, queries: List[str]) -> np.ndarray:
+        """Embed queries in one batched, L2-normalized encode."""
+        return self._embedder.encode(
+            queries,
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype(np.float32, copy=False)
+    
+    def _search_matrix(self, query_embeddings: np.ndarray, n_results: int) -> List[tuple]:
+        """Exact top-k by cosine similarity against the in-memory matrix."""
+        # Work on negated similarities, flipped in place, so the selection
+        # and the final sort need no further temporary arrays
+        neg = query_embeddings @ self._matrix.T
+        np.negative(neg, out=neg)
+        
+        # O(N) selection of the k best, then sort only those k
+        k = min(n_results, neg.shape[1])
+        if k < neg.shape[1]:
+            top = np.argpartition(neg, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(k), neg.shape)
+        top_neg = np.take_along_axis(neg, top, axis=1)
+        order = np.argsort(top_neg, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_sims = -np.take_along_axis(top_neg, order, axis=1)
+        
+        return [
+            (
+                tuple(
+                    Characteristic._make(self._metas[j] + (similarity,))
+                    for j, similarity in zip(idx, sims.tolist())
+                ),
+                sims
+            )
+            for idx, sims in zip(top, top_sims)
+        ]
+    
+    def _search_chroma(self, query_embeddings: np.ndarray, n_results: int) -> List[tuple]:
+        """Top-k from a ChromaDB query."""
         results = self.collection.query(
-            query_texts=[query],
+            query_embeddings=query_embeddings.tolist(),
             n_results=n_results
         )
         
-        # Format results
-        characteristics = []
-        for metadata, distance in zip(results['metadatas'][0], results['distances'][0]):
-            similarity = 1 - distance  # Convert distance to similarity
-            
-            if similarity >= min_similarity:
-                characteristics.append({
-                    'name': metadata['name'],
-                    'description': metadata['description'],
-                    'valueType': metadata['valueType'],
-                    'similarity': similarity
-                })
+        rows = []
+        for metadatas, distances in zip(results['metadatas'], results['distances']):
+            similarities = 1 - np.asarray(distances)  # Convert distance to similarity
+            rows.append((
+                tuple(
+                    Characteristic(
+                        metadata['name'], metadata['description'], metadata['valueType'],
+                        similarity
+                    )
+                    for metadata, similarity in zip(metadatas, similarities.tolist())
+                ),
+                similarities
+            ))
+        return rows
+    
+    @staticmethod
+    def _format(ranked: tuple, min_similarity: float) -> List[Characteristic]:
+        """Results above the threshold (immutable, so shared with the cache)."""
+        characteristics, similarities = ranked
         
-        return characteristics
+        # Results are sorted by descending similarity, so the threshold keeps
+        # a prefix; find its length with one binary search
+        keep = int(np.searchsorted(-similarities, -min_similarity, side='right'))
+        
+        return list(characteristics[:keep])
     
     def retrieve_for_scenario(
         self, 
         scenario: str, 
-        n_results: int = 5
-    ) -> List[Dict[str, Any]]:
+        n_results: int = 5,
+        no_cache: bool = False
+    ) -> List[Characteristic]:
         """
         Retrieve characteristics relevant to a specific scenario.
         
         Args:
             scenario: Natural language scenario description
             n_results: Number of characteristics to retrieve
+            no_cache: Bypass the query cache
             
         Returns:
             List of relevant characteristics
         """
         # Enhance query for better retrieval
-        query = f"network slice requirements: {scenario}"
+        query = _PREFIX + scenario
         
-        return self.retrieve(query, n_results=n_results)
+        return self.retrieve(query, n_results=n_results, no_cache=no_cache)
+    
+    def retrieve_for_scenarios(
+        self,
+        scenarios: List[str],
+        n_results: int = 5,
+        no_cache: bool = False
+    ) -> List[List[Characteristic]]:
+        """
+        Batched retrieve_for_scenario: one ChromaDB call for all scenarios.
+        
+        Args:
+            scenarios: Natural language scenario descriptions
+            n_results: Number of characteristics to retrieve per scenario
+            no_cache: Bypass the query cache
+            
+        Returns:
+            One list of relevant characteristics per scenario
+        """
+        queries = [_PREFIX + scenario for scenario in scenarios]
+        
+        return self.retrieve_batch(queries, n_results=n_results, no_cache=no_cache)
 
 
 if __name__ == "__main__":
@@ -94,18 +472,18 @@ if __name__ == "__main__":
         "Provision remote surgery network with ultra-low latency (1ms), 99.999% reliability, and 100 Mbps guaranteed bandwidth."
     ]
     
-    for i, scenario in enumerate(test_scenarios, 1):
+    all_characteristics = retriever.retrieve_for_scenarios(test_scenarios, n_results=5)
+    
+    for i, (scenario, characteristics) in enumerate(zip(test_scenarios, all_characteristics), 1):
         print(f"Scenario {i}: {scenario[:60]}...")
         print("-" * 80)
         
-        characteristics = retriever.retrieve_for_scenario(scenario, n_results=5)
-        
         print(f"\nRetrieved {len(characteristics)} characteristics:\n")
         for j, char in enumerate(characteristics, 1):
-            print(f"{j}. {char['name']}")
-            print(f"   Type: {char['valueType']}, Similarity: {char['similarity']:.3f}")
-            if char['description']:
-                print(f"   Description: {char['description'][:80]}...")
+            print(f"{j}. {char.name}")
+            print(f"   Type: {char.valueType}, Similarity: {char.similarity:.3f}")
+            if char.description:
+                print(f"   Description: {char.description[:80]}...")
             print()
         
         print("="*80 + "\n")
@@ -1,23 +1,41 @@
 """Configuration utilities."""
 
+import copy
+import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config; mtime_ns only keys the cache."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
     Load configuration from YAML file.
     
+    The file is parsed once per modification; every call gets its own
+    copy, so callers may modify the result.
+    
     Args:
         config_path: Path to config file
         
     Returns:
         Configuration dictionary
     """
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    return config
+    path = os.path.abspath(config_path)
+    return copy.deepcopy(_load_config_cached(path, os.stat(path).st_mtime_ns))
 
 
 def get_model_config(config: Dict[str, Any], model_name: str) -> Dict[str, Any]:
@@ -15,9 +15,24 @@ def compute_feaci_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Dictionary of computed metrics
     """
-    valid_results = [r for r in results if r.get('validation')]
+    # Single pass over the results accumulating every counter at once
+    num_results = 0
+    format_valid = 0
+    overall_valid = 0
+    total_tokens = 0
+    total_time = 0.0
+    for r in results:
+        validation = r.get('validation')
+        if not validation:
+            continue
+        num_results += 1
+        format_valid += bool(validation['format_valid'])
+        overall_valid += bool(validation['overall_valid'])
+        metrics = r['metrics']
+        total_tokens += metrics['tokens']
+        total_time += metrics['time_seconds']
     
-    if not valid_results:
+    if not num_results:
         return {
             'format_correctness': 0.0,
             'accuracy': 0.0,
@@ -27,20 +42,16 @@ def compute_feaci_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         }
     
     # Format correctness
-    format_valid = sum(1 for r in valid_results if r['validation']['format_valid'])
-    format_correctness = format_valid / len(valid_results) * 100
+    format_correctness = format_valid / num_results * 100
     
     # Accuracy
-    overall_valid = sum(1 for r in valid_results if r['validation']['overall_valid'])
-    accuracy = overall_valid / len(valid_results) * 100
+    accuracy = overall_valid / num_results * 100
     
     # Cost (tokens)
-    total_tokens = sum(r['metrics']['tokens'] for r in valid_results)
-    avg_tokens = total_tokens / len(valid_results)
+    avg_tokens = total_tokens / num_results
     
     # Inference time
-    total_time = sum(r['metrics']['time_seconds'] for r in valid_results)
-    avg_time = total_time / len(valid_results)
+    avg_time = total_time / num_results
     
     return {
         'format_correctness': format_correctness,
@@ -49,7 +60,7 @@ def compute_feaci_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         'cost_total_tokens': total_tokens,
         'inference_time_avg_seconds': avg_time,
         'inference_time_total_seconds': total_time,
-        'num_results': len(valid_results)
+        'num_results': num_results
     }
 
 